@@ -30,26 +30,30 @@ Quick start::
     pipe.execute()                  # [True, True]
 """
 
-# Exception hierarchy
-from pyrsedis._pyrsedis import (
-    BusyError,
-    ClusterDownError,
-    ClusterError,
-    GraphError,
-    NoScriptError,
-    Pipeline,
-    ProtocolError,
-    PyrsedisError,
-    ReadOnlyError,
-    Redis,
-    RedisConnectionError,
-    RedisError,
-    RedisTimeoutError,
-    ResponseError,
-    SentinelError,
-    WrongTypeError,
-    __version__,
-)
+from typing import TYPE_CHECKING
+
+from pyrsedis import _pyrsedis
+from pyrsedis._pyrsedis import Pipeline, Redis, __version__
+
+if TYPE_CHECKING:
+    # Bound lazily at runtime (see ``__getattr__`` below); imported here so
+    # type checkers see the real classes instead of ``Any``.
+    from pyrsedis._pyrsedis import (
+        BusyError,
+        ClusterDownError,
+        ClusterError,
+        GraphError,
+        NoScriptError,
+        ProtocolError,
+        PyrsedisError,
+        ReadOnlyError,
+        RedisConnectionError,
+        RedisError,
+        RedisTimeoutError,
+        ResponseError,
+        SentinelError,
+        WrongTypeError,
+    )
 
 __all__ = [
     "__version__",
@@ -71,3 +75,19 @@ __all__ = [
     "ClusterError",
     "SentinelError",
 ]
+
+# Exception classes are resolved from the native module on first access
+# (PEP 562), so ``import pyrsedis`` only binds the client types.
+_LAZY = frozenset(__all__) - {"__version__", "Pipeline", "Redis"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(_pyrsedis, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -93,6 +93,8 @@ class Redis:
         idle_timeout_ms: int = 300000,
         max_buffer_size: int = 67108864,
         decode_responses: bool = True,
+        auto_pipeline: bool = False,
+        decode_cache: bool = False,
     ) -> None:
         """Create a new Redis client.
 
@@ -111,6 +113,11 @@ class Redis:
                 Defaults to 64 MiB.
             decode_responses: If ``False``, return bulk-string responses as
                 ``bytes`` instead of ``str``.
+            auto_pipeline: If ``True``, commands issued concurrently from
+                several threads are batched into shared round-trips.
+            decode_cache: If ``True``, repeated small bulk-string replies
+                (up to 64 bytes) reuse one cached ``str`` object. Pays off
+                when values repeat; leave off for mostly unique strings.
 
         Raises:
             RedisConnectionError: If the initial connection cannot be established.
@@ -125,6 +132,8 @@ class Redis:
         read_timeout_ms: int = 30000,
         idle_timeout_ms: int = 300000,
         decode_responses: bool = True,
+        auto_pipeline: bool = False,
+        decode_cache: bool = False,
     ) -> "Redis":
         """Create a client from a ``redis://``, ``rediss://``, ``redis+sentinel://``,
         or ``redis+cluster://`` URL.
@@ -135,6 +144,12 @@ class Redis:
             implemented in v0.1.0.  The client connects to the first host
             as a standalone server.
 
+        Live clients created with the same connection settings (host, port,
+        db, credentials, ``pool_size`` and timeouts) share a single
+        connection pool, so repeated calls reuse open connections. The
+        shared pool is checked with a ``PING`` before reuse and is closed
+        once the last client using it is gone.
+
         Args:
             url: Connection URL.  Format:
                 ``redis://[user:password@]host[:port][/db]``
@@ -144,6 +159,11 @@ class Redis:
             idle_timeout_ms: Idle-connection eviction timeout in milliseconds.
             decode_responses: If ``False``, return bulk-string responses as
                 ``bytes``.
+            auto_pipeline: If ``True``, commands issued concurrently from
+                several threads are batched into shared round-trips.
+            decode_cache: If ``True``, repeated small bulk-string replies
+                (up to 64 bytes) reuse one cached ``str`` object. Pays off
+                when values repeat; leave off for mostly unique strings.
 
         Returns:
             A new :class:`Redis` instance.
@@ -171,6 +191,28 @@ class Redis:
         """
         ...
 
+    def pipeline_exec(self, cmds: list[list[str]]) -> list[Any]:
+        """Execute a batch of raw commands in a single round-trip.
+
+        All commands are encoded into one buffer and sent in one write,
+        without building an intermediate :class:`Pipeline`.
+
+        Args:
+            cmds: List of commands, each a list of the command name
+                followed by its arguments.
+
+        Returns:
+            A list of responses, one per command.
+
+        Raises:
+            TypeError: If any command is empty.
+
+        Example:
+            >>> r.pipeline_exec([["SET", "a", "1"], ["GET", "a"]])
+            ['OK', '1']
+        """
+        ...
+
     def pipeline(self) -> "Pipeline":
         """Create a pipeline for batching multiple commands.
 
@@ -231,6 +273,29 @@ class Redis:
         """
         ...
 
+    def get_into(self, name: str, buf: bytearray) -> Optional[int]:
+        """Get the value of a key into a caller-provided ``bytearray``.
+
+        The value is copied directly from the read buffer into ``buf``,
+        skipping the intermediate ``bytes``/``str`` object. ``buf`` is
+        grown if it is too small and never shrunk, so one buffer can be
+        reused across calls.
+
+        Args:
+            name: Key name.
+            buf: Destination buffer.
+
+        Returns:
+            The number of bytes written to the start of ``buf``, or
+            ``None`` if the key does not exist.
+
+        Example:
+            >>> buf = bytearray(4096)
+            >>> n = r.get_into("blob", buf)
+            >>> data = memoryview(buf)[:n]
+        """
+        ...
+
     def delete(self, *names: str) -> int:
         """Delete one or more keys.
 
@@ -1902,6 +1967,32 @@ class Pipeline:
 
     # ── Sorted set ──────────────────────────────────────────────
 
+    def zadd(
+        self,
+        name: str,
+        mapping: dict[str, float],
+        nx: bool = False,
+        xx: bool = False,
+        gt: bool = False,
+        lt: bool = False,
+        ch: bool = False,
+    ) -> "Pipeline":
+        """Buffer a ``ZADD`` command.
+
+        Args:
+            name: Sorted-set key name.
+            mapping: A ``{member: score}`` dictionary.
+            nx: Only add new elements (do not update existing).
+            xx: Only update existing elements (do not add new).
+            gt: Only update when the new score is greater than the current.
+            lt: Only update when the new score is less than the current.
+            ch: Return the number of *changed* elements instead of added.
+
+        Returns:
+            ``self`` for chaining.
+        """
+        ...
+
     def zscore(self, name: str, member: str) -> "Pipeline":
         """Buffer a ``ZSCORE`` command.
 
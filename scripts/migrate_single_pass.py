@@ -1,51 +1,62 @@
 #!/usr/bin/env python3
 """Migrate client.rs methods from two-pass to single-pass exec_raw."""
-import re
+try:
+    import re2 as re  # google-re2: linear-time matching
+except ImportError:
+    import re
 
-with open("src/client.rs", "r") as f:
+with open("src/client.rs", "rb") as f:
     content = f.read()
 
-# Pattern 1: Simple commands with literal array args
+# Both shapes share the same wrapper and differ only in the execute() args,
+# so one alternation scans the file once:
+#
 # let result = py.detach(|| {
-#     runtime::block_on(self.router.execute(&["CMD", ...]))
+#     runtime::block_on(self.router.execute(&["CMD", ...]))   <- lit
+#     runtime::block_on(self.router.execute(&cmd))            <- var
 # }).map_err(|e| -> PyErr { e.into() })?;
 # self.to_python(py, result)
-pattern1 = re.compile(
-    r'let result = py\.detach\(\|\| \{\s*'
-    r'runtime::block_on\(self\.router\.execute\((&\[.*?\])\)\)\s*'
-    r'\}\)\.map_err\(\|e\| -> PyErr \{ e\.into\(\) \}\)\?;\s*'
-    r'self\.to_python\(py, result\)',
+#
+# The literal body is matched lazily up to the `]))` that closes the call,
+# so nested brackets such as `&[..., &args[1..]]` stay inside the match; it
+# may not contain `;`, `{` or `}`, which keeps a match inside one statement.
+pattern = re.compile(
+    rb'let result = py\.detach\(\|\| \{\s*'
+    rb'runtime::block_on\(self\.router\.execute\('
+    rb'(?:(?P<lit>&\[[^;{}]*?\])|(?P<var>&\w+))'
+    rb'\)\)\s*'
+    rb'\}\)\.map_err\(\|e\| -> PyErr \{ e\.into\(\) \}\)\?;\s*'
+    rb'self\.to_python\(py, result\)',
     re.DOTALL
 )
 
-count1 = [0]
-def replace1(m):
-    count1[0] += 1
-    args = m.group(1)
-    return f'self.exec_raw(py, {args})?'
-
-content = pattern1.sub(replace1, content)
-print(f"Pattern 1 (literal arrays): {count1[0]}")
-
-# Pattern 2: Commands with variable args (&cmd, &refs, etc.)
-pattern2 = re.compile(
-    r'let result = py\.detach\(\|\| \{\s*'
-    r'runtime::block_on\(self\.router\.execute\((&\w+)\)\)\s*'
-    r'\}\)\.map_err\(\|e\| -> PyErr \{ e\.into\(\) \}\)\?;\s*'
-    r'self\.to_python\(py, result\)',
-    re.DOTALL
-)
-
-count2 = [0]
-def replace2(m):
-    count2[0] += 1
-    args = m.group(1)
-    return f'self.exec_raw(py, {args})?'
-
-content = pattern2.sub(replace2, content)
-print(f"Pattern 2 (variable args): {count2[0]}")
-
-with open("src/client.rs", "w") as f:
+# exec_raw already returns PyResult<Py<PyAny>>, and the matched call is
+# always the tail expression of the method, so it is emitted without `?`.
+counts = {"lit": 0, "var": 0}
+def replace(m):
+    kind = "lit" if m.group("lit") is not None else "var"
+    counts[kind] += 1
+    return b'self.exec_raw(py, ' + m.group(kind) + b')'
+
+content = pattern.sub(replace, content)
+print(f"Pattern 1 (literal arrays): {counts['lit']}")
+print(f"Pattern 2 (variable args): {counts['var']}")
+
+# Anything still calling the router directly did not fit either shape;
+# list it instead of leaving it behind silently.
+for m in re.finditer(rb'runtime::block_on\(self\.router\.execute\(', content):
+    line = content.count(b"\n", 0, m.start()) + 1
+    print(f"Not migrated: src/client.rs:{line}")
+
+# exec_raw is implemented in terms of the Router trait
+if b'use crate::router::Router;' not in content:
+    content = content.replace(
+        b'use crate::router::standalone::StandaloneRouter;',
+        b'use crate::router::Router;\nuse crate::router::standalone::StandaloneRouter;'
+    )
+    print("Added Router import")
+
+with open("src/client.rs", "wb") as f:
     f.write(content)
 
-print(f"Total replaced: {count1[0] + count2[0]}")
+print(f"Total replaced: {counts['lit'] + counts['var']}")
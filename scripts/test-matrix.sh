@@ -6,6 +6,7 @@
 #   ./scripts/test-matrix.sh 3.13       # single version
 #   ./scripts/test-matrix.sh 3.13t      # single free-threaded version
 #   ./scripts/test-matrix.sh bench      # benchmark suite (current venv)
+#   ./scripts/test-matrix.sh bench --bench-only  # extra args go to pytest
 #
 # Prerequisites:
 #   - uv >= 0.4  (brew install uv)
@@ -92,7 +93,7 @@ run_bench() {
 
   echo "  Running benchmarks..."
   uv run --extra dev --with maturin \
-     pytest tests/python/test_benchmark.py -v -s --tb=short
+     pytest tests/python/test_benchmark.py -v -s --tb=short "$@"
 }
 
 print_summary() {
@@ -120,7 +121,8 @@ if [[ $# -eq 0 ]]; then
   done
   print_summary
 elif [[ "$1" == "bench" ]]; then
-  run_bench
+  shift
+  run_bench "$@"
 else
   # Run specific version(s)
   for ver in "$@"; do
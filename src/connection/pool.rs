@@ -1,8 +1,14 @@
 //! Async connection pool for Redis connections.
 //!
-//! Uses a semaphore for max size control and a deque for idle connection reuse.
-//! The idle queue uses `parking_lot::Mutex` (sync, held very briefly) so
+//! Uses a semaphore for max size control and deques for idle connection reuse.
+//! The idle queues use `parking_lot::Mutex` (sync, held very briefly) so
 //! connections can be returned in `Drop` without needing async.
+//!
+//! The idle connections are split across several shards. Each calling
+//! thread has a home shard, so threads calling in parallel (e.g. under
+//! free-threaded CPython) mostly lock different mutexes. A thread whose
+//! home shard is empty steals from the others before opening a new
+//! connection.
 
 use crate::config::ConnectionConfig;
 use crate::connection::tcp::RedisConnection;
@@ -10,13 +16,26 @@ use crate::error::{PyrsedisError, Result};
 
 use parking_lot::Mutex as SyncMutex;
 use std::collections::VecDeque;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use std::time::Duration;
 use tokio::sync::{Semaphore, SemaphorePermit};
 
+/// Upper bound on the number of idle-queue shards in one pool.
+const MAX_IDLE_SHARDS: usize = 16;
+
+/// Source of per-thread home shard indices (round-robin).
+static NEXT_SHARD_HINT: AtomicUsize = AtomicUsize::new(0);
+
+thread_local! {
+    /// This thread's home shard index, before reduction modulo the shard count.
+    static SHARD_HINT: usize = NEXT_SHARD_HINT.fetch_add(1, Ordering::Relaxed);
+}
+
 /// An async connection pool.
 pub struct ConnectionPool {
-    /// Idle connections ready for reuse (sync mutex — held very briefly).
-    idle: SyncMutex<VecDeque<RedisConnection>>,
+    /// Idle connections ready for reuse, sharded by calling thread
+    /// (sync mutexes — held very briefly).
+    idle: Box<[SyncMutex<VecDeque<RedisConnection>>]>,
     /// Semaphore limiting total checked-out connections.
     semaphore: Semaphore,
     /// Pool configuration.
@@ -32,8 +51,12 @@ impl ConnectionPool {
     pub fn new(config: ConnectionConfig) -> Self {
         let max_size = config.pool_size;
         let idle_timeout = Duration::from_millis(config.idle_timeout_ms);
+        let cpus = std::thread::available_parallelism().map_or(1, |n| n.get());
+        let shards = max_size.min(cpus).clamp(1, MAX_IDLE_SHARDS);
         Self {
-            idle: SyncMutex::new(VecDeque::with_capacity(max_size)),
+            idle: (0..shards)
+                .map(|_| SyncMutex::new(VecDeque::with_capacity(max_size.div_ceil(shards))))
+                .collect(),
             semaphore: Semaphore::new(max_size),
             config,
             max_size,
@@ -57,11 +80,8 @@ impl ConnectionPool {
                 ))
             })?;
 
-        // Try to get an idle connection (sync lock, very brief)
-        let conn = {
-            let mut idle = self.idle.lock();
-            self.take_healthy_connection(&mut idle)
-        };
+        // Try to get an idle connection (sync locks, very brief)
+        let conn = self.take_idle();
 
         let conn = match conn {
             Some(c) => c,
@@ -77,7 +97,7 @@ impl ConnectionPool {
 
     /// Return the number of currently idle connections.
     pub fn idle_count(&self) -> usize {
-        self.idle.lock().len()
+        self.idle.iter().map(|shard| shard.lock().len()).sum()
     }
 
     /// Return the configured max pool size.
@@ -124,7 +144,24 @@ impl ConnectionPool {
         Ok(conn)
     }
 
-    /// Take a healthy connection from the idle queue (LIFO for cache warmth).
+    /// Index of the calling thread's home shard.
+    #[inline]
+    fn home_shard(&self) -> usize {
+        SHARD_HINT.with(|hint| *hint) % self.idle.len()
+    }
+
+    /// Take an idle connection, trying the home shard first and then
+    /// stealing from the others.
+    fn take_idle(&self) -> Option<RedisConnection> {
+        let shards = self.idle.len();
+        let home = self.home_shard();
+        (0..shards).find_map(|i| {
+            let mut idle = self.idle[(home + i) % shards].lock();
+            self.take_healthy_connection(&mut idle)
+        })
+    }
+
+    /// Take a healthy connection from an idle queue (LIFO for cache warmth).
     fn take_healthy_connection(
         &self,
         idle: &mut VecDeque<RedisConnection>,
@@ -143,7 +180,7 @@ impl ConnectionPool {
         if conn.last_used.elapsed() > self.idle_timeout {
             return; // Drop stale connection
         }
-        let mut idle = self.idle.lock();
+        let mut idle = self.idle[self.home_shard()].lock();
         if idle.len() < self.max_size {
             idle.push_back(conn);
         }
@@ -272,6 +309,51 @@ mod tests {
         assert_eq!(pool.idle_count(), 1);
     }
 
+    #[tokio::test(flavor = "multi_thread", worker_threads = 2)]
+    async fn pool_reuses_connections_across_threads() {
+        let addr = mock_redis_server().await;
+        let pool = std::sync::Arc::new(ConnectionPool::new(test_config(&addr)));
+
+        {
+            let mut guard = pool.get().await.unwrap();
+            guard.conn().execute_str(&["PING"]).await.unwrap();
+        }
+        assert_eq!(pool.idle_count(), 1);
+
+        // Another thread finds the idle connection even if it lives in a
+        // different shard, and returns it to its own.
+        let handle = tokio::runtime::Handle::current();
+        let other = std::sync::Arc::clone(&pool);
+        tokio::task::spawn_blocking(move || {
+            handle.block_on(async {
+                let mut guard = other.get().await.unwrap();
+                assert_eq!(other.idle_count(), 0);
+                guard.conn().execute_str(&["PING"]).await.unwrap();
+            })
+        })
+        .await
+        .unwrap();
+        assert_eq!(pool.idle_count(), 1);
+
+        let _guard = pool.get().await.unwrap();
+        assert_eq!(pool.idle_count(), 0);
+    }
+
+    #[test]
+    fn pool_shard_count_bounded() {
+        let pool = ConnectionPool::new(ConnectionConfig {
+            pool_size: 1,
+            ..ConnectionConfig::default()
+        });
+        assert_eq!(pool.idle.len(), 1);
+
+        let pool = ConnectionPool::new(ConnectionConfig {
+            pool_size: 1000,
+            ..ConnectionConfig::default()
+        });
+        assert!(pool.idle.len() >= 1 && pool.idle.len() <= MAX_IDLE_SHARDS);
+    }
+
     #[tokio::test]
     async fn pool_limits_connections() {
         let addr = mock_redis_server().await;
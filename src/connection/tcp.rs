@@ -4,14 +4,14 @@
 //! RESP parser for efficient, streaming request/response I/O.
 
 use crate::error::{PyrsedisError, Result};
-use crate::resp::parser::{parse, resp_frame_len};
+use crate::resp::parser::{bulk_frame_len_hint, parse, resp_frame_len};
 use crate::resp::types::RespValue;
-use crate::resp::writer::{encode_command, encode_command_str};
+use crate::resp::writer::{encode_command_into, encode_command_str_into};
 
 use bytes::{Bytes, BytesMut};
 use std::time::Instant;
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
-use tokio::net::TcpStream;
+use tokio::net::{TcpSocket, TcpStream};
 
 /// Default initial read buffer capacity (64 KB).
 const DEFAULT_BUF_CAPACITY: usize = 64 * 1024;
@@ -23,11 +23,58 @@ const DEFAULT_BUF_CAPACITY: usize = 64 * 1024;
 /// Users can configure a higher limit if needed.
 pub const DEFAULT_MAX_BUF_SIZE: usize = 64 * 1024 * 1024;
 
+/// Initial capacity of the per-connection command encode buffer (4 KB).
+const WRITE_BUF_CAPACITY: usize = 4 * 1024;
+
+/// Largest encode buffer kept between commands (64 KB).
+///
+/// A command with a huge value grows the buffer temporarily; it is released
+/// afterwards so idle pooled connections don't pin that memory.
+const WRITE_BUF_RETAIN: usize = 64 * 1024;
+
+/// Socket send buffer size (`SO_SNDBUF`, 1 MB).
+///
+/// Large enough that a typical pipeline batch is accepted by the kernel
+/// in a single write instead of being drip-fed as the buffer drains.
+const SEND_BUF_SIZE: u32 = 1024 * 1024;
+
+/// Resolve `addr` and connect, sizing the send buffer before the handshake.
+///
+/// Tries each resolved address in turn, like `TcpStream::connect`.
+async fn open_stream(addr: &str) -> std::io::Result<TcpStream> {
+    let mut last_err = None;
+    for sock_addr in tokio::net::lookup_host(addr).await? {
+        let socket = if sock_addr.is_ipv4() {
+            TcpSocket::new_v4()?
+        } else {
+            TcpSocket::new_v6()?
+        };
+        if let Err(e) = socket.set_send_buffer_size(SEND_BUF_SIZE) {
+            // Not fatal: the default buffer works, large batches just take
+            // more write calls.
+            log::warn!("could not set SO_SNDBUF to {SEND_BUF_SIZE} for {sock_addr}: {e}");
+        }
+        match socket.connect(sock_addr).await {
+            Ok(stream) => return Ok(stream),
+            Err(e) => last_err = Some(e),
+        }
+    }
+    Err(last_err.unwrap_or_else(|| {
+        std::io::Error::new(
+            std::io::ErrorKind::InvalidInput,
+            format!("could not resolve {addr} to any address"),
+        )
+    }))
+}
+
 /// A single async connection to a Redis server.
 pub struct RedisConnection {
     stream: TcpStream,
     /// Read buffer (data read from socket but not yet consumed by parser).
     buf: BytesMut,
+    /// Scratch buffer commands are encoded into before writing; cleared,
+    /// not freed, between commands.
+    wbuf: Vec<u8>,
     /// Maximum allowed buffer size.
     max_buf_size: usize,
     /// Per-read timeout (0 = no timeout).
@@ -44,11 +91,12 @@ impl RedisConnection {
 
     /// Connect with a configurable max buffer size.
     pub async fn connect_with_max_buf(addr: &str, max_buf_size: usize) -> Result<Self> {
-        let stream = TcpStream::connect(addr).await?;
+        let stream = open_stream(addr).await?;
         stream.set_nodelay(true).ok(); // Disable Nagle for low latency
         Ok(Self {
             stream,
             buf: BytesMut::with_capacity(DEFAULT_BUF_CAPACITY),
+            wbuf: Vec::with_capacity(WRITE_BUF_CAPACITY),
             max_buf_size,
             read_timeout: None,
             last_used: Instant::now(),
@@ -114,6 +162,26 @@ impl RedisConnection {
         Ok(())
     }
 
+    /// Encode a command into the connection's scratch buffer and send it.
+    ///
+    /// Avoids allocating a fresh request buffer for every command.
+    pub async fn send_command(&mut self, args: &[&str]) -> Result<()> {
+        self.wbuf.clear();
+        encode_command_str_into(&mut self.wbuf, args);
+        self.flush_wbuf().await
+    }
+
+    /// Write the encoded scratch buffer, then trim it if a large command grew it.
+    async fn flush_wbuf(&mut self) -> Result<()> {
+        let result = self.stream.write_all(&self.wbuf).await;
+        if self.wbuf.capacity() > WRITE_BUF_RETAIN {
+            self.wbuf = Vec::with_capacity(WRITE_BUF_CAPACITY);
+        }
+        result?;
+        self.last_used = Instant::now();
+        Ok(())
+    }
+
     /// Read and parse one complete RESP value from the server.
     ///
     /// Freezes the read buffer to `Bytes` before parsing, enabling
@@ -173,8 +241,10 @@ impl RedisConnection {
     /// no `RespValue` tree). The caller can parse on the GIL-holding thread
     /// to avoid a second traversal.
     pub async fn read_raw_response(&mut self) -> Result<Bytes> {
+        // Buffered bytes required before another frame-length scan can succeed.
+        let mut need = 1;
         loop {
-            if !self.buf.is_empty() {
+            if self.buf.len() >= need {
                 match resp_frame_len(&self.buf) {
                     Ok(len) => {
                         // Split off exactly `len` bytes and freeze them
@@ -183,7 +253,13 @@ impl RedisConnection {
                         return Ok(raw);
                     }
                     Err(PyrsedisError::Incomplete) => {
-                        // fall through to read more
+                        // A bulk string declares its length up front: skip
+                        // rescanning until all of it has arrived, and size
+                        // the buffer for it in one allocation.
+                        need = bulk_frame_len_hint(&self.buf).unwrap_or(self.buf.len() + 1);
+                        if need > self.buf.capacity() && need <= self.max_buf_size {
+                            self.buf.reserve(need - self.buf.len());
+                        }
                     }
                     Err(e) => return Err(e),
                 }
@@ -210,15 +286,15 @@ impl RedisConnection {
 
     /// Send a command and read the response.
     pub async fn execute(&mut self, args: &[&[u8]]) -> Result<RespValue> {
-        let cmd = encode_command(args);
-        self.send_raw(&cmd).await?;
+        self.wbuf.clear();
+        encode_command_into(&mut self.wbuf, args);
+        self.flush_wbuf().await?;
         self.read_response().await
     }
 
     /// Send a command (string args) and read the response.
     pub async fn execute_str(&mut self, args: &[&str]) -> Result<RespValue> {
-        let cmd = encode_command_str(args);
-        self.send_raw(&cmd).await?;
+        self.send_command(args).await?;
         self.read_response().await
     }
 
@@ -361,6 +437,28 @@ mod tests {
         assert!(result);
     }
 
+    #[tokio::test]
+    async fn connect_sets_nodelay() {
+        let addr = mock_server(b"+PONG\r\n".to_vec()).await;
+        let conn = RedisConnection::connect(&addr).await.unwrap();
+        assert!(conn.stream.nodelay().unwrap());
+    }
+
+    #[tokio::test]
+    async fn connect_sets_send_buffer() {
+        let addr = mock_server(b"+PONG\r\n".to_vec()).await;
+        let conn = RedisConnection::connect(&addr).await.unwrap();
+        let actual = socket2::SockRef::from(&conn.stream).send_buffer_size().unwrap();
+
+        // The kernel may double the request (Linux) or clamp it to its own
+        // maximum (net.core.wmem_max), so compare against what a fresh
+        // socket is granted for the same request.
+        let probe = TcpSocket::new_v4().unwrap();
+        probe.set_send_buffer_size(SEND_BUF_SIZE).unwrap();
+        let granted = probe.send_buffer_size().unwrap() as usize;
+        assert!(actual >= granted.min(SEND_BUF_SIZE as usize), "SO_SNDBUF {actual} < granted {granted}");
+    }
+
     #[tokio::test]
     async fn connect_and_execute_str() {
         let addr = mock_server(b"+OK\r\n".to_vec()).await;
@@ -532,6 +630,44 @@ mod tests {
         }
     }
 
+    #[tokio::test]
+    async fn large_raw_response_in_chunks() {
+        let data = vec![b'y'; 200_000];
+        let mut response = format!("${}\r\n", data.len()).into_bytes();
+        response.extend_from_slice(&data);
+        response.extend_from_slice(b"\r\n+PONG\r\n");
+
+        let listener = TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let addr = listener.local_addr().unwrap().to_string();
+        tokio::spawn(async move {
+            let (mut socket, _) = listener.accept().await.unwrap();
+            for chunk in response.chunks(7_000) {
+                socket.write_all(chunk).await.unwrap();
+                socket.flush().await.unwrap();
+            }
+            socket.shutdown().await.ok();
+        });
+
+        let mut conn = RedisConnection::connect(&addr).await.unwrap();
+        let raw = conn.read_raw_response().await.unwrap();
+        assert_eq!(raw.len(), 9 + 200_000 + 2);
+        assert!(raw[9..9 + 200_000].iter().all(|&b| b == b'y'));
+        let next = conn.read_raw_response().await.unwrap();
+        assert_eq!(next, Bytes::from_static(b"+PONG\r\n"));
+    }
+
+    #[tokio::test]
+    async fn write_buffer_trimmed_after_large_command() {
+        let addr = mock_server_multi(vec![b"+OK\r\n".to_vec(), b"+OK\r\n".to_vec()]).await;
+        let mut conn = RedisConnection::connect(&addr).await.unwrap();
+        conn.execute_str(&["SET", "k", "v"]).await.unwrap();
+        assert_eq!(conn.wbuf.capacity(), WRITE_BUF_CAPACITY);
+
+        let big = "x".repeat(WRITE_BUF_RETAIN * 2);
+        conn.send_command(&["SET", "k", &big]).await.unwrap();
+        assert!(conn.wbuf.capacity() <= WRITE_BUF_RETAIN);
+    }
+
     #[tokio::test]
     async fn last_used_updates() {
         let addr = mock_server(b"+PONG\r\n".to_vec()).await;
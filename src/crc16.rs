@@ -3,15 +3,21 @@
 //! Redis Cluster uses CRC16 with the XMODEM polynomial (0x1021) to map keys
 //! to one of 16384 hash slots.
 
+use memchr::memchr;
+
 /// Number of hash slots in a Redis Cluster.
 pub const SLOT_COUNT: u16 = 16384;
 
-/// CRC16-XMODEM lookup table (polynomial 0x1021).
-static CRC16_TABLE: [u16; 256] = {
-    let mut table = [0u16; 256];
-    let mut i = 0u16;
+/// CRC16-XMODEM slicing-by-8 lookup tables (polynomial 0x1021).
+///
+/// `CRC16_TABLES[0]` is the classic byte-at-a-time table; `CRC16_TABLES[k]`
+/// gives the CRC contribution of a byte followed by `k` zero bytes, so eight
+/// input bytes can be folded in with eight independent lookups.
+static CRC16_TABLES: [[u16; 256]; 8] = {
+    let mut tables = [[0u16; 256]; 8];
+    let mut i = 0usize;
     while i < 256 {
-        let mut crc = i << 8;
+        let mut crc = (i as u16) << 8;
         let mut j = 0;
         while j < 8 {
             if crc & 0x8000 != 0 {
@@ -21,18 +27,43 @@ static CRC16_TABLE: [u16; 256] = {
             }
             j += 1;
         }
-        table[i as usize] = crc;
+        tables[0][i] = crc;
         i += 1;
     }
-    table
+    let mut k = 1;
+    while k < 8 {
+        let mut i = 0usize;
+        while i < 256 {
+            let prev = tables[k - 1][i];
+            tables[k][i] = (prev << 8) ^ tables[0][(prev >> 8) as usize];
+            i += 1;
+        }
+        k += 1;
+    }
+    tables
 };
 
 /// Compute CRC16-XMODEM checksum of `data`.
+///
+/// Processes eight bytes per step (slicing-by-8), then finishes the tail
+/// one byte at a time.
 pub fn crc16(data: &[u8]) -> u16 {
+    let t = &CRC16_TABLES;
     let mut crc: u16 = 0;
-    for &byte in data {
+    let mut chunks = data.chunks_exact(8);
+    for c in &mut chunks {
+        crc = t[7][(c[0] ^ (crc >> 8) as u8) as usize]
+            ^ t[6][(c[1] ^ crc as u8) as usize]
+            ^ t[5][c[2] as usize]
+            ^ t[4][c[3] as usize]
+            ^ t[3][c[4] as usize]
+            ^ t[2][c[5] as usize]
+            ^ t[1][c[6] as usize]
+            ^ t[0][c[7] as usize];
+    }
+    for &byte in chunks.remainder() {
         let idx = ((crc >> 8) ^ (byte as u16)) as usize;
-        crc = (crc << 8) ^ CRC16_TABLE[idx];
+        crc = (crc << 8) ^ t[0][idx];
     }
     crc
 }
@@ -45,9 +76,9 @@ pub fn crc16(data: &[u8]) -> u16 {
 ///
 /// Returns the portion of the key that should be hashed.
 pub fn extract_hash_tag(key: &[u8]) -> &[u8] {
-    if let Some(open) = key.iter().position(|&b| b == b'{') {
+    if let Some(open) = memchr(b'{', key) {
         // Look for '}' after the '{', must have at least 1 char between
-        if let Some(close_offset) = key[open + 1..].iter().position(|&b| b == b'}') {
+        if let Some(close_offset) = memchr(b'}', &key[open + 1..]) {
             if close_offset > 0 {
                 return &key[open + 1..open + 1 + close_offset];
             }
@@ -94,6 +125,22 @@ mod tests {
         assert_ne!(crc16(b"a"), crc16(b"b"));
     }
 
+    #[test]
+    fn crc16_sliced_matches_bytewise() {
+        fn bytewise(data: &[u8]) -> u16 {
+            let mut crc: u16 = 0;
+            for &byte in data {
+                let idx = ((crc >> 8) ^ (byte as u16)) as usize;
+                crc = (crc << 8) ^ CRC16_TABLES[0][idx];
+            }
+            crc
+        }
+        let data: Vec<u8> = (0..200u32).map(|i| (i.wrapping_mul(37) ^ (i >> 3)) as u8).collect();
+        for len in 0..data.len() {
+            assert_eq!(crc16(&data[..len]), bytewise(&data[..len]), "len {len}");
+        }
+    }
+
     #[test]
     fn crc16_different_inputs() {
         assert_ne!(crc16(b"hello"), crc16(b"world"));
@@ -152,6 +152,24 @@ pub fn resp_frame_len(buf: &[u8]) -> Result<usize> {
     }
 }
 
+/// Total length of a bulk-type frame (`$`, `!`, `=`) at the front of `buf`,
+/// known as soon as its header line is buffered.
+///
+/// Returns `None` for other frame types, null bulk strings, or when the
+/// header itself is still incomplete. A reader waiting on a large bulk
+/// string uses this to jump straight to the declared length instead of
+/// re-scanning the partial buffer after every socket read.
+pub fn bulk_frame_len_hint(buf: &[u8]) -> Option<usize> {
+    match buf.first()? {
+        b'$' | b'!' | b'=' => {
+            let (line, next) = read_line(buf, 1).ok()?;
+            let len = parse_int_from_bytes(line).ok()?;
+            usize::try_from(len).ok().map(|len| next + len + 2)
+        }
+        _ => None,
+    }
+}
+
 // ── Helpers ────────────────────────────────────────────────────────
 
 /// Find the next `\r\n` in `buf` starting at `offset`.
@@ -1139,6 +1157,24 @@ mod tests {
         assert!(parse_slice(b"+OK\rX").is_err());
     }
 
+    // ── bulk frame length hint ──
+
+    #[test]
+    fn bulk_hint_from_header_only() {
+        assert_eq!(bulk_frame_len_hint(b"$100000\r\nxx"), Some(9 + 100_000 + 2));
+        assert_eq!(bulk_frame_len_hint(b"$5\r\nhello\r\n"), Some(11));
+        assert_eq!(bulk_frame_len_hint(b"!3\r\nERR\r\n"), Some(9));
+    }
+
+    #[test]
+    fn bulk_hint_none_cases() {
+        assert_eq!(bulk_frame_len_hint(b""), None);
+        assert_eq!(bulk_frame_len_hint(b"$10"), None);
+        assert_eq!(bulk_frame_len_hint(b"$-1\r\n"), None);
+        assert_eq!(bulk_frame_len_hint(b"*2\r\n"), None);
+        assert_eq!(bulk_frame_len_hint(b"+OK\r\n"), None);
+    }
+
     // ── integer sign only ──
 
     #[test]
@@ -22,29 +22,69 @@ pub fn encode_command(args: &[&[u8]]) -> Vec<u8> {
     }
 
     let mut buf = Vec::with_capacity(cap);
-    let mut itoa_buf = Buffer::new();
+    encode_command_into(&mut buf, args);
+    buf
+}
 
-    // *<N>\r\n
-    buf.push(b'*');
-    buf.extend_from_slice(itoa_buf.format(args.len()).as_bytes());
-    buf.extend_from_slice(b"\r\n");
+/// Append a RESP-encoded command to an existing buffer.
+///
+/// Used to accumulate pipelined commands in one contiguous buffer as
+/// they are issued, so the batch is ready to send without re-encoding.
+pub fn encode_command_into(buf: &mut Vec<u8>, args: &[&[u8]]) {
+    encode_args_into(buf, args);
+}
 
+/// Append a RESP-encoded command given as string arguments.
+///
+/// Unlike [`encode_command_str`], this needs no temporary `Vec<&[u8]>`
+/// and reuses `buf`'s allocation.
+pub fn encode_command_str_into(buf: &mut Vec<u8>, args: &[&str]) {
+    encode_args_into(buf, args);
+}
+
+#[inline]
+fn encode_args_into<A: AsRef<[u8]>>(buf: &mut Vec<u8>, args: &[A]) {
+    write_array_header(buf, args.len());
     for arg in args {
-        // $<len>\r\n<data>\r\n
-        buf.push(b'$');
-        buf.extend_from_slice(itoa_buf.format(arg.len()).as_bytes());
-        buf.extend_from_slice(b"\r\n");
-        buf.extend_from_slice(arg);
+        write_bulk(buf, arg.as_ref());
+    }
+}
+
+/// Append a `*<n>\r\n` array header.
+///
+/// Single-digit counts (almost every command) skip integer formatting;
+/// when `n` is a constant, as in [`cmd_into!`], the branch folds away.
+#[inline(always)]
+pub fn write_array_header(buf: &mut Vec<u8>, n: usize) {
+    if n < 10 {
+        buf.extend_from_slice(&[b'*', b'0' + n as u8, b'\r', b'\n']);
+    } else {
+        buf.push(b'*');
+        buf.extend_from_slice(Buffer::new().format(n).as_bytes());
         buf.extend_from_slice(b"\r\n");
     }
+}
 
-    buf
+/// Append one `$<len>\r\n<data>\r\n` bulk string.
+#[inline(always)]
+pub fn write_bulk(buf: &mut Vec<u8>, arg: &[u8]) {
+    let mut itoa_buf = Buffer::new();
+    let len = itoa_buf.format(arg.len()).as_bytes();
+    buf.reserve(1 + len.len() + 2 + arg.len() + 2);
+    buf.push(b'$');
+    buf.extend_from_slice(len);
+    buf.extend_from_slice(b"\r\n");
+    buf.extend_from_slice(arg);
+    buf.extend_from_slice(b"\r\n");
 }
 
 /// Encode a command from string arguments (convenience wrapper).
 pub fn encode_command_str(args: &[&str]) -> Vec<u8> {
-    let byte_args: Vec<&[u8]> = args.iter().map(|s| s.as_bytes()).collect();
-    encode_command(&byte_args)
+    // Same sizing as `encode_command`: header + per-arg framing + data
+    let cap = 1 + 10 + 2 + args.iter().map(|a| 1 + 10 + 2 + a.len() + 2).sum::<usize>();
+    let mut buf = Vec::with_capacity(cap);
+    encode_command_str_into(&mut buf, args);
+    buf
 }
 
 /// Encode multiple commands into a single buffer for pipelined writes.
@@ -113,6 +153,32 @@ macro_rules! cmd {
     }};
 }
 
+/// Append a fixed-arity command to a `Vec<u8>` without building an
+/// argument slice.
+///
+/// Expands to one header write plus one [`write_bulk`] per argument —
+/// straight-line code with the argument count known at compile time.
+/// Arguments may be anything that is `AsRef<[u8]>` (`&str`, `&String`,
+/// `&[u8]`, …).
+///
+/// Usage:
+/// ```ignore
+/// let mut buf = Vec::new();
+/// cmd_into!(&mut buf, "HSET", &name, &key, &value);
+/// ```
+#[macro_export]
+macro_rules! cmd_into {
+    (@unit $arg:expr) => {
+        ()
+    };
+    ($buf:expr, $($arg:expr),+ $(,)?) => {{
+        let buf: &mut Vec<u8> = $buf;
+        const N: usize = [$($crate::cmd_into!(@unit $arg)),+].len();
+        $crate::resp::writer::write_array_header(buf, N);
+        $( $crate::resp::writer::write_bulk(buf, AsRef::<[u8]>::as_ref($arg)); )+
+    }};
+}
+
 // ── Tests ──────────────────────────────────────────────────────────
 
 #[cfg(test)]
@@ -141,6 +207,51 @@ mod tests {
         );
     }
 
+    #[test]
+    fn encode_into_appends() {
+        let mut buf = encode_command(&[b"PING"]);
+        encode_command_into(&mut buf, &[b"GET", b"k"]);
+        assert_eq!(buf, b"*1\r\n$4\r\nPING\r\n*2\r\n$3\r\nGET\r\n$1\r\nk\r\n");
+    }
+
+    #[test]
+    fn encode_str_into_reuses_buffer() {
+        let mut buf = Vec::with_capacity(64);
+        encode_command_str_into(&mut buf, &["SET", "k", "v"]);
+        assert_eq!(buf, encode_command(&[b"SET", b"k", b"v"]));
+        let cap = buf.capacity();
+        buf.clear();
+        encode_command_str_into(&mut buf, &["GET", "k"]);
+        assert_eq!(buf, b"*2\r\n$3\r\nGET\r\n$1\r\nk\r\n");
+        assert_eq!(buf.capacity(), cap);
+    }
+
+    #[test]
+    fn cmd_into_matches_encode_command() {
+        let mut buf = Vec::new();
+        let key = String::from("user:1000");
+        cmd_into!(&mut buf, "HSET", &key, "name", b"x".as_ref());
+        assert_eq!(buf, encode_command(&[b"HSET", b"user:1000", b"name", b"x"]));
+    }
+
+    #[test]
+    fn header_and_bulk_length_boundaries() {
+        use crate::resp::types::RespValue;
+        let long = vec![b'a'; 100];
+        let args: Vec<&[u8]> = vec![b"123456789", b"1234567890", &long];
+        let many: Vec<&[u8]> = vec![b"x"; 12];
+        for cmd in [&args, &many] {
+            let mut buf = Vec::new();
+            encode_command_into(&mut buf, cmd);
+            let (value, used) = crate::resp::parser::parse_slice(&buf).unwrap();
+            assert_eq!(used, buf.len());
+            match value {
+                RespValue::Array(items) => assert_eq!(items.len(), cmd.len()),
+                other => panic!("expected array, got {other:?}"),
+            }
+        }
+    }
+
     #[test]
     fn encode_empty_arg() {
         let result = encode_command(&[b"SET", b"key", b""]);
@@ -11,6 +11,7 @@ use crate::error::PyrsedisError;
 use crate::resp::types::RespValue;
 
 use memchr::memchr;
+use parking_lot::Mutex;
 use pyo3::prelude::*;
 use pyo3::types::{PyBool, PyBytes, PyDict, PyFloat, PyList, PySet, PyString};
 
@@ -33,6 +34,87 @@ const MAX_PARSE_DEPTH: usize = 512;
 /// large numbers. Cap at 10,000 digits to prevent CPU DoS.
 const MAX_BIGNUMBER_LEN: usize = 10_000;
 
+/// Bulk strings up to this many bytes go through the decode cache.
+const DECODE_CACHE_MAX_LEN: usize = 64;
+
+/// Number of slots in the decode cache (must be a power of two).
+const DECODE_CACHE_SLOTS: usize = 4096;
+
+/// One decode cache entry: the raw payload and the `str` built from it.
+struct DecodeSlot {
+    len: u8,
+    bytes: [u8; DECODE_CACHE_MAX_LEN],
+    value: Py<PyString>,
+}
+
+/// Slots plus hit counters, guarded together by [`DecodeCache`]'s lock.
+#[derive(Default)]
+struct DecodeCacheState {
+    slots: Vec<Option<DecodeSlot>>,
+    hits: u64,
+    lookups: u64,
+}
+
+/// Direct-mapped cache of recently decoded small bulk strings, owned by
+/// one client (`Redis(decode_cache=True)`).
+///
+/// Replies that repeat the same short values (tags, enum names, field
+/// names) get a new reference to the existing `str` on a hit, skipping
+/// UTF-8 validation and the `PyUnicode` allocation. Every lookup costs a
+/// hash, a lock and, on a miss, a copy into the slot, so it only pays off
+/// when values repeat; that is why it is opt-in. A colliding payload
+/// replaces its slot, so at most `DECODE_CACHE_SLOTS` strings are kept.
+#[derive(Default)]
+pub struct DecodeCache {
+    state: Mutex<DecodeCacheState>,
+}
+
+impl DecodeCache {
+    /// Decode a small bulk string to `str` through the cache.
+    ///
+    /// Returns `None` if `data` is not valid UTF-8 or the cache is busy on
+    /// another thread; the caller then falls back to the uncached path.
+    fn decode(&self, py: Python<'_>, data: &[u8]) -> Option<Py<PyAny>> {
+        debug_assert!(data.len() <= DECODE_CACHE_MAX_LEN);
+        let mut state = self.state.try_lock()?;
+        if state.slots.is_empty() {
+            state.slots.resize_with(DECODE_CACHE_SLOTS, || None);
+        }
+        state.lookups += 1;
+        let index = decode_slot(data);
+        if let Some(entry) = &state.slots[index] {
+            if &entry.bytes[..entry.len as usize] == data {
+                let obj = entry.value.clone_ref(py).into_any();
+                state.hits += 1;
+                return Some(obj);
+            }
+        }
+        let s = std::str::from_utf8(data).ok()?;
+        let value = PyString::new(py, s).unbind();
+        let mut bytes = [0u8; DECODE_CACHE_MAX_LEN];
+        bytes[..data.len()].copy_from_slice(data);
+        let obj = value.clone_ref(py).into_any();
+        state.slots[index] = Some(DecodeSlot { len: data.len() as u8, bytes, value });
+        Some(obj)
+    }
+
+    /// `(hits, lookups)` since the cache was created.
+    pub fn stats(&self) -> (u64, u64) {
+        let state = self.state.lock();
+        (state.hits, state.lookups)
+    }
+}
+
+/// FNV-1a hash of a small payload, reduced to a cache slot index.
+#[inline]
+fn decode_slot(data: &[u8]) -> usize {
+    let mut h: u64 = 0xcbf2_9ce4_8422_2325;
+    for &b in data {
+        h = (h ^ b as u64).wrapping_mul(0x0000_0100_0000_01b3);
+    }
+    (h as usize) & (DECODE_CACHE_SLOTS - 1)
+}
+
 /// Build a Python list of `count` elements in-place using CPython FFI.
 ///
 /// Uses `PyList_New` (pre-sized) + `PyList_SET_ITEM` (steals references),
@@ -62,6 +144,7 @@ unsafe fn build_pylist_ffi(
     count: usize,
     depth: usize,
     decode: bool,
+    cache: Option<&DecodeCache>,
 ) -> PyResult<(Py<PyAny>, usize)> {
     let list_ptr = pyo3::ffi::PyList_New(count as isize);
     if list_ptr.is_null() {
@@ -69,7 +152,7 @@ unsafe fn build_pylist_ffi(
     }
 
     for i in 0..count {
-        match parse_inner(py, buf, pos, depth, decode) {
+        match parse_inner(py, buf, pos, depth, decode, cache) {
             Ok((item, end)) => {
                 pos = end;
                 pyo3::ffi::PyList_SET_ITEM(list_ptr, i as isize, item.into_ptr());
@@ -422,13 +505,24 @@ pub fn parse_to_python(
     py: Python<'_>,
     buf: &Bytes,
     decode: bool,
+) -> PyResult<(Py<PyAny>, usize)> {
+    parse_to_python_cached(py, buf, decode, None)
+}
+
+/// [`parse_to_python`] that decodes small bulk strings through `cache`
+/// (only consulted when `decode` is true).
+pub fn parse_to_python_cached(
+    py: Python<'_>,
+    buf: &Bytes,
+    decode: bool,
+    cache: Option<&DecodeCache>,
 ) -> PyResult<(Py<PyAny>, usize)> {
     if buf.is_empty() {
         return Err(PyrsedisError::Incomplete.into());
     }
     // Delegate to the inner function that works on &[u8] with offset tracking.
     // This avoids Bytes::slice() atomic refcount ops on every recursive call.
-    let (obj, end) = parse_inner(py, buf, 0, 0, decode)?;
+    let (obj, end) = parse_inner(py, buf, 0, 0, decode, cache)?;
     Ok((obj, end))
 }
 
@@ -443,6 +537,7 @@ fn parse_inner(
     pos: usize,
     depth: usize,
     decode: bool,
+    cache: Option<&DecodeCache>,
 ) -> PyResult<(Py<PyAny>, usize)> {
     if depth > MAX_PARSE_DEPTH {
         return Err(PyrsedisError::Protocol(
@@ -492,6 +587,11 @@ fn parse_inner(
             }
             let data = &buf[next..next + len];
             if decode {
+                if let Some(cache) = cache.filter(|_| len <= DECODE_CACHE_MAX_LEN) {
+                    if let Some(obj) = cache.decode(py, data) {
+                        return Ok((obj, total));
+                    }
+                }
                 match std::str::from_utf8(data) {
                     Ok(s) => Ok((PyString::new(py, s).into_any().unbind(), total)),
                     Err(_) => Ok((PyBytes::new(py, data).into_any().unbind(), total)),
@@ -509,7 +609,7 @@ fn parse_inner(
             }
             let count = validated_count(count)?;
             // SAFETY: parse_inner produces valid Py<PyAny>, build_pylist_ffi handles errors
-            unsafe { build_pylist_ffi(py, buf, next, count, depth + 1, decode) }
+            unsafe { build_pylist_ffi(py, buf, next, count, depth + 1, decode, cache) }
         }
         b'_' => {
             // Null
@@ -595,9 +695,9 @@ fn parse_inner(
             let count = validated_count(count)?;
             let dict = PyDict::new(py);
             for _ in 0..count {
-                let (key, end_k) = parse_inner(py, buf, next, depth + 1, decode)?;
+                let (key, end_k) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
                 next = end_k;
-                let (val, end_v) = parse_inner(py, buf, next, depth + 1, decode)?;
+                let (val, end_v) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
                 next = end_v;
                 dict.set_item(key, val)?;
             }
@@ -610,7 +710,7 @@ fn parse_inner(
             let count = validated_count(count)?;
             let set = PySet::empty(py)?;
             for _ in 0..count {
-                let (item, end) = parse_inner(py, buf, next, depth + 1, decode)?;
+                let (item, end) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
                 next = end;
                 set.add(item)?;
             }
@@ -622,7 +722,7 @@ fn parse_inner(
             let count = fused_parse_int(line).map_err(|e| -> PyErr { e.into() })?;
             let count = validated_count(count)?;
             // SAFETY: same as array arm
-            unsafe { build_pylist_ffi(py, buf, next, count, depth + 1, decode) }
+            unsafe { build_pylist_ffi(py, buf, next, count, depth + 1, decode, cache) }
         }
         b'|' => {
             // Attribute → dict with __data__ and __attrs__
@@ -631,13 +731,13 @@ fn parse_inner(
             let count = validated_count(count)?;
             let attrs_dict = PyDict::new(py);
             for _ in 0..count {
-                let (key, end_k) = parse_inner(py, buf, next, depth + 1, decode)?;
+                let (key, end_k) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
                 next = end_k;
-                let (val, end_v) = parse_inner(py, buf, next, depth + 1, decode)?;
+                let (val, end_v) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
                 next = end_v;
                 attrs_dict.set_item(key, val)?;
             }
-            let (data, end) = parse_inner(py, buf, next, depth + 1, decode)?;
+            let (data, end) = parse_inner(py, buf, next, depth + 1, decode, cache)?;
             next = end;
             let dict = PyDict::new(py);
             dict.set_item("__attrs__", attrs_dict)?;
@@ -924,6 +1024,70 @@ mod tests {
         });
     }
 
+    #[test]
+    fn python_decode_cache_reuses_str() {
+        Python::attach(|py| {
+            let cache = DecodeCache::default();
+            let buf = Bytes::from_static(b"$6\r\nactive\r\n");
+            let (a, _) = parse_to_python_cached(py, &buf, true, Some(&cache)).unwrap();
+            let (b, _) = parse_to_python_cached(py, &buf, true, Some(&cache)).unwrap();
+            assert_eq!(a.extract::<String>(py).unwrap(), "active");
+            assert_eq!(a.as_ptr(), b.as_ptr());
+            assert_eq!(cache.stats(), (1, 2));
+        });
+    }
+
+    #[test]
+    fn python_decode_cache_unused_without_cache_or_decode() {
+        Python::attach(|py| {
+            let cache = DecodeCache::default();
+            let buf = Bytes::from_static(b"$6\r\nactive\r\n");
+            parse_to_python(py, &buf, true).unwrap();
+            let (raw, _) = parse_to_python_cached(py, &buf, false, Some(&cache)).unwrap();
+            assert_eq!(raw.extract::<Vec<u8>>(py).unwrap(), b"active");
+            assert_eq!(cache.stats(), (0, 0));
+        });
+    }
+
+    #[test]
+    fn python_decode_cache_hit_rate_on_repeated_values() {
+        // 1,000 status-like values drawn from 8 distinct strings: after the
+        // first 8 misses every lookup is a hit.
+        let names = ["active", "inactive", "pending", "banned", "admin", "user", "guest", "bot"];
+        let mut raw = b"*1000\r\n".to_vec();
+        for i in 0..1000 {
+            let name = names[i % names.len()];
+            raw.extend_from_slice(format!("${}\r\n{name}\r\n", name.len()).as_bytes());
+        }
+        let buf = Bytes::from(raw);
+        Python::attach(|py| {
+            let cache = DecodeCache::default();
+            let (obj, _) = parse_to_python_cached(py, &buf, true, Some(&cache)).unwrap();
+            assert_eq!(obj.extract::<Vec<String>>(py).unwrap()[9], "inactive");
+            let (hits, lookups) = cache.stats();
+            assert_eq!(lookups, 1000);
+            assert_eq!(hits, 992);
+        });
+    }
+
+    #[test]
+    fn python_decode_cache_skips_invalid_utf8() {
+        Python::attach(|py| {
+            let cache = DecodeCache::default();
+            let buf = Bytes::from_static(b"$2\r\n\xff\xfe\r\n");
+            let (obj, _) = parse_to_python_cached(py, &buf, true, Some(&cache)).unwrap();
+            let b: Vec<u8> = obj.extract(py).unwrap();
+            assert_eq!(b, b"\xff\xfe");
+        });
+    }
+
+    #[test]
+    fn decode_slot_in_range() {
+        for data in [&b""[..], b"a", b"user:1000", &[0xffu8; 64]] {
+            assert!(decode_slot(data) < DECODE_CACHE_SLOTS);
+        }
+    }
+
     #[test]
     fn python_verbatim_string() {
         Python::attach(|py| {
@@ -0,0 +1,269 @@
+//! Automatic pipelining of concurrent single commands.
+//!
+//! Callers on different threads enqueue encoded commands into a channel.
+//! A background task drains whatever has queued up (up to [`MAX_BATCH`])
+//! and sends it as one pipeline on a pooled connection, then hands each
+//! reply back through a oneshot. Concurrent callers share writes and
+//! round-trips without any change to the per-command API.
+
+use std::sync::Arc;
+
+use bytes::Bytes;
+use tokio::sync::{mpsc, oneshot, Semaphore};
+
+use crate::error::{PyrsedisError, Result};
+use crate::resp::writer::encode_command_str;
+use crate::router::standalone::StandaloneRouter;
+use crate::runtime;
+
+/// Maximum number of queued commands coalesced into one batch.
+pub const MAX_BATCH: usize = 64;
+
+/// A queued command and where to deliver its reply.
+struct Request {
+    cmd: Vec<u8>,
+    reply: oneshot::Sender<Result<Bytes>>,
+}
+
+/// Handle for submitting commands to the auto-pipelining task.
+///
+/// The background task exits once every handle has been dropped.
+pub struct AutoPipeline {
+    tx: mpsc::UnboundedSender<Request>,
+}
+
+impl AutoPipeline {
+    /// Start the batching task for `router`.
+    ///
+    /// At most `max_in_flight` batches are outstanding at once (normally
+    /// the pool size); while they are, new commands keep queuing and are
+    /// coalesced into the next batch.
+    pub fn new(router: Arc<StandaloneRouter>, max_in_flight: usize) -> Self {
+        let (tx, rx) = mpsc::unbounded_channel();
+        let permits = Arc::new(Semaphore::new(max_in_flight.max(1)));
+        runtime::spawn(run(router, rx, permits));
+        Self { tx }
+    }
+
+    /// Queue a command and wait for its raw RESP reply.
+    pub async fn execute_raw(&self, args: &[&str]) -> Result<Bytes> {
+        let (reply, rx) = oneshot::channel();
+        let request = Request {
+            cmd: encode_command_str(args),
+            reply,
+        };
+        if self.tx.send(request).is_err() {
+            return Err(closed());
+        }
+        rx.await.map_err(|_| closed())?
+    }
+}
+
+/// Drain the queue into batches until all senders are gone.
+async fn run(
+    router: Arc<StandaloneRouter>,
+    mut rx: mpsc::UnboundedReceiver<Request>,
+    permits: Arc<Semaphore>,
+) {
+    loop {
+        // Wait for batch capacity first so that commands arriving while
+        // every batch slot is busy accumulate in the channel.
+        let Ok(permit) = Arc::clone(&permits).acquire_owned().await else {
+            return;
+        };
+        let Some(first) = rx.recv().await else {
+            return;
+        };
+
+        let mut buf = first.cmd;
+        let mut replies = Vec::with_capacity(MAX_BATCH);
+        replies.push(first.reply);
+        while replies.len() < MAX_BATCH {
+            match rx.try_recv() {
+                Ok(req) => {
+                    buf.extend_from_slice(&req.cmd);
+                    replies.push(req.reply);
+                }
+                Err(_) => break,
+            }
+        }
+
+        let router = Arc::clone(&router);
+        tokio::spawn(async move {
+            let _permit = permit;
+            let (frames, err) = router.pipeline_encoded_raw_partial(&buf, replies.len()).await;
+            deliver(replies, frames, err);
+        });
+    }
+}
+
+/// Hand each caller its reply.
+///
+/// Commands whose reply was read get it even if the batch failed later,
+/// so a caller never sees an error for a command that is known to have
+/// run (and never retries a non-idempotent write like INCR because of
+/// it). Only the unanswered commands get the batch error.
+fn deliver(replies: Vec<oneshot::Sender<Result<Bytes>>>, frames: Vec<Bytes>, err: Option<PyrsedisError>) {
+    let mut replies = replies.into_iter();
+    // `frames` drives the zip so no sender is consumed past the last frame.
+    for (frame, reply) in frames.into_iter().zip(replies.by_ref()) {
+        let _ = reply.send(Ok(frame));
+    }
+    if let Some(e) = err {
+        for reply in replies {
+            let _ = reply.send(Err(replicate(&e)));
+        }
+    }
+}
+
+/// Error returned when the batching task is gone.
+fn closed() -> PyrsedisError {
+    PyrsedisError::Connection(std::io::Error::new(
+        std::io::ErrorKind::BrokenPipe,
+        "auto-pipeline task stopped",
+    ))
+}
+
+/// Copy a batch-level error for each waiting caller (`io::Error` is not `Clone`).
+fn replicate(e: &PyrsedisError) -> PyrsedisError {
+    match e {
+        PyrsedisError::Connection(io) => {
+            PyrsedisError::Connection(std::io::Error::new(io.kind(), io.to_string()))
+        }
+        PyrsedisError::Protocol(msg) => PyrsedisError::Protocol(msg.clone()),
+        PyrsedisError::Incomplete => PyrsedisError::Incomplete,
+        PyrsedisError::Redis { kind, message } => PyrsedisError::Redis {
+            kind: kind.clone(),
+            message: message.clone(),
+        },
+        PyrsedisError::Graph(msg) => PyrsedisError::Graph(msg.clone()),
+        PyrsedisError::Type(msg) => PyrsedisError::Type(msg.clone()),
+        PyrsedisError::Timeout(msg) => PyrsedisError::Timeout(msg.clone()),
+        PyrsedisError::Cluster(msg) => PyrsedisError::Cluster(msg.clone()),
+        PyrsedisError::Sentinel(msg) => PyrsedisError::Sentinel(msg.clone()),
+    }
+}
+
+// ── Tests ──────────────────────────────────────────────────────────
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::config::ConnectionConfig;
+    use std::sync::atomic::{AtomicI64, Ordering};
+    use tokio::io::{AsyncReadExt, AsyncWriteExt};
+    use tokio::net::TcpListener;
+
+    /// Mock server that answers every command it receives with an
+    /// increasing integer, shared across connections.
+    async fn counting_server() -> String {
+        let listener = TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let addr = listener.local_addr().unwrap().to_string();
+        let counter = Arc::new(AtomicI64::new(0));
+
+        tokio::spawn(async move {
+            while let Ok((mut socket, _)) = listener.accept().await {
+                let counter = Arc::clone(&counter);
+                tokio::spawn(async move {
+                    let mut buf = vec![0u8; 4096];
+                    loop {
+                        let n = match socket.read(&mut buf).await {
+                            Ok(0) | Err(_) => break,
+                            Ok(n) => n,
+                        };
+                        // Every command starts with `*` at the start of a line.
+                        let data = &buf[..n];
+                        let commands = (0..n)
+                            .filter(|&i| data[i] == b'*' && (i == 0 || data[i - 1] == b'\n'))
+                            .count();
+                        let mut out = Vec::new();
+                        for _ in 0..commands {
+                            let v = counter.fetch_add(1, Ordering::SeqCst) + 1;
+                            out.extend_from_slice(format!(":{v}\r\n").as_bytes());
+                        }
+                        if socket.write_all(&out).await.is_err() {
+                            break;
+                        }
+                    }
+                });
+            }
+        });
+
+        tokio::time::sleep(std::time::Duration::from_millis(10)).await;
+        addr
+    }
+
+    fn router_for(addr: &str) -> Arc<StandaloneRouter> {
+        let parts: Vec<&str> = addr.split(':').collect();
+        Arc::new(StandaloneRouter::new(ConnectionConfig {
+            host: parts[0].to_string(),
+            port: parts[1].parse().unwrap(),
+            pool_size: 2,
+            connect_timeout_ms: 1000,
+            ..ConnectionConfig::default()
+        }))
+    }
+
+    #[tokio::test]
+    async fn single_command_roundtrip() {
+        let addr = counting_server().await;
+        let mux = AutoPipeline::new(router_for(&addr), 2);
+        let reply = mux.execute_raw(&["INCR", "k"]).await.unwrap();
+        assert_eq!(reply, Bytes::from_static(b":1\r\n"));
+    }
+
+    #[tokio::test]
+    async fn concurrent_commands_each_get_one_reply() {
+        let addr = counting_server().await;
+        let mux = Arc::new(AutoPipeline::new(router_for(&addr), 2));
+
+        let handles: Vec<_> = (0..50)
+            .map(|_| {
+                let mux = Arc::clone(&mux);
+                tokio::spawn(async move { mux.execute_raw(&["INCR", "k"]).await.unwrap() })
+            })
+            .collect();
+
+        let mut values = Vec::new();
+        for h in handles {
+            let raw = h.await.unwrap();
+            let text = std::str::from_utf8(&raw[1..raw.len() - 2]).unwrap();
+            values.push(text.parse::<i64>().unwrap());
+        }
+        values.sort_unstable();
+        assert_eq!(values, (1..=50).collect::<Vec<_>>());
+    }
+
+    #[tokio::test]
+    async fn connect_failure_reaches_every_caller() {
+        let mux = AutoPipeline::new(router_for("127.0.0.1:1"), 1);
+        let err = mux.execute_raw(&["PING"]).await.unwrap_err();
+        assert!(matches!(err, PyrsedisError::Connection(_)));
+    }
+
+    #[test]
+    fn deliver_keeps_replies_read_before_failure() {
+        let (senders, mut receivers): (Vec<_>, Vec<_>) = (0..3).map(|_| oneshot::channel()).unzip();
+        let frames = vec![Bytes::from_static(b":1\r\n"), Bytes::from_static(b":2\r\n")];
+        deliver(senders, frames, Some(PyrsedisError::Timeout("read timed out".into())));
+
+        assert_eq!(receivers[0].try_recv().unwrap().unwrap(), Bytes::from_static(b":1\r\n"));
+        assert_eq!(receivers[1].try_recv().unwrap().unwrap(), Bytes::from_static(b":2\r\n"));
+        assert!(matches!(receivers[2].try_recv().unwrap(), Err(PyrsedisError::Timeout(_))));
+    }
+
+    #[test]
+    fn replicate_keeps_variant() {
+        let e = PyrsedisError::Timeout("read timed out".into());
+        assert!(matches!(replicate(&e), PyrsedisError::Timeout(m) if m == "read timed out"));
+
+        let e = PyrsedisError::Connection(std::io::Error::new(
+            std::io::ErrorKind::ConnectionReset,
+            "reset",
+        ));
+        match replicate(&e) {
+            PyrsedisError::Connection(io) => assert_eq!(io.kind(), std::io::ErrorKind::ConnectionReset),
+            other => panic!("unexpected {other:?}"),
+        }
+    }
+}
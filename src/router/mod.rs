@@ -1,7 +1,9 @@
+pub mod autopipeline;
 pub mod cluster;
 pub mod sentinel;
 pub mod standalone;
 
+pub use autopipeline::AutoPipeline;
 pub use cluster::ClusterRouter;
 pub use sentinel::SentinelRouter;
 pub use standalone::StandaloneRouter;
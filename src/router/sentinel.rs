@@ -121,8 +121,7 @@ impl SentinelRouter {
                 }
             };
 
-            let cmd = encode_command_str(args);
-            if let Err(e) = guard.conn().send_raw(&cmd).await {
+            if let Err(e) = guard.conn().send_command(args).await {
                 last_err = Some(e);
                 continue;
             }
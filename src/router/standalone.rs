@@ -5,9 +5,9 @@
 use bytes::Bytes;
 use crate::config::ConnectionConfig;
 use crate::connection::pool::ConnectionPool;
-use crate::error::Result;
+use crate::error::{PyrsedisError, Result};
 use crate::resp::types::RespValue;
-use crate::resp::writer::{encode_command_str, encode_pipeline};
+use crate::resp::writer::encode_pipeline;
 use crate::router::Router;
 
 /// Router for standalone (single-server) Redis topology.
@@ -29,8 +29,7 @@ impl StandaloneRouter {
     /// The caller can then do a single-pass `parse_to_python` with the GIL held.
     pub async fn execute_raw(&self, args: &[&str]) -> Result<Bytes> {
         let mut guard = self.pool.get().await?;
-        let cmd = encode_command_str(args);
-        guard.conn().send_raw(&cmd).await?;
+        guard.conn().send_command(args).await?;
         guard.conn().read_raw_response().await
     }
 
@@ -39,23 +38,60 @@ impl StandaloneRouter {
     /// Each response is returned as raw bytes (no parsing) so the caller
     /// can do single-pass `parse_to_python` with the GIL held.
     pub async fn pipeline_raw(&self, commands: &[Vec<String>]) -> Result<Vec<Bytes>> {
-        let mut guard = self.pool.get().await?;
         let buf = encode_pipeline(commands);
-        guard.conn().send_raw(&buf).await?;
+        self.pipeline_encoded_raw(&buf, commands.len()).await
+    }
 
-        let mut responses = Vec::with_capacity(commands.len());
-        for _ in commands {
-            responses.push(guard.conn().read_raw_response().await?);
+    /// Send an already RESP-encoded batch of `count` commands and return
+    /// the raw RESP frames.
+    ///
+    /// Lets callers that buffer commands in wire format (e.g. `Pipeline`)
+    /// skip re-encoding at flush time.
+    pub async fn pipeline_encoded_raw(&self, buf: &[u8], count: usize) -> Result<Vec<Bytes>> {
+        match self.pipeline_encoded_raw_partial(buf, count).await {
+            (responses, None) => Ok(responses),
+            (_, Some(e)) => Err(e),
         }
-        Ok(responses)
+    }
+
+    /// Like [`pipeline_encoded_raw`](Self::pipeline_encoded_raw), but keeps
+    /// the replies that arrived before a failure.
+    ///
+    /// Returns the frames read so far, in command order, and the error that
+    /// stopped the batch, if any. Commands past the returned frames got no
+    /// reply: they may or may not have run on the server.
+    pub async fn pipeline_encoded_raw_partial(
+        &self,
+        buf: &[u8],
+        count: usize,
+    ) -> (Vec<Bytes>, Option<PyrsedisError>) {
+        let mut responses = Vec::with_capacity(count);
+        let mut guard = match self.pool.get().await {
+            Ok(guard) => guard,
+            Err(e) => return (responses, Some(e)),
+        };
+        if let Err(e) = guard.conn().send_raw(buf).await {
+            return (responses, Some(e));
+        }
+        for _ in 0..count {
+            match guard.conn().read_raw_response().await {
+                Ok(frame) => responses.push(frame),
+                Err(e) => return (responses, Some(e)),
+            }
+        }
+        (responses, None)
+    }
+
+    /// Configured maximum number of pooled connections.
+    pub fn pool_size(&self) -> usize {
+        self.pool.max_size()
     }
 }
 
 impl Router for StandaloneRouter {
     async fn execute(&self, args: &[&str]) -> Result<RespValue> {
         let mut guard = self.pool.get().await?;
-        let cmd = encode_command_str(args);
-        guard.conn().send_raw(&cmd).await?;
+        guard.conn().send_command(args).await?;
         guard.conn().read_response().await
     }
 
@@ -90,6 +126,7 @@ impl Router for StandaloneRouter {
 mod tests {
     use super::*;
     use bytes::Bytes;
+    use crate::resp::writer::encode_command_into;
     use tokio::io::{AsyncReadExt, AsyncWriteExt};
     use tokio::net::TcpListener;
 
@@ -188,6 +225,36 @@ mod tests {
         assert_eq!(results[2], RespValue::Integer(42));
     }
 
+    #[tokio::test]
+    async fn standalone_pipeline_encoded_raw() {
+        let addr = mock_server_with_responses(vec![b"+OK\r\n:7\r\n".to_vec()]).await;
+        let router = StandaloneRouter::new(router_config(&addr));
+
+        let mut buf = Vec::new();
+        encode_command_into(&mut buf, &[b"SET", b"k", b"v"]);
+        encode_command_into(&mut buf, &[b"INCR", b"n"]);
+
+        let results = router.pipeline_encoded_raw(&buf, 2).await.unwrap();
+        assert_eq!(results, vec![Bytes::from_static(b"+OK\r\n"), Bytes::from_static(b":7\r\n")]);
+    }
+
+    #[tokio::test]
+    async fn standalone_pipeline_encoded_raw_partial() {
+        // Two of the three replies arrive, then the server closes the socket.
+        let addr = mock_server_with_responses(vec![b"+OK\r\n:7\r\n".to_vec()]).await;
+        let router = StandaloneRouter::new(router_config(&addr));
+
+        let mut buf = Vec::new();
+        encode_command_into(&mut buf, &[b"SET", b"k", b"v"]);
+        encode_command_into(&mut buf, &[b"INCR", b"n"]);
+        encode_command_into(&mut buf, &[b"INCR", b"n"]);
+
+        let (frames, err) = router.pipeline_encoded_raw_partial(&buf, 3).await;
+        assert_eq!(frames, vec![Bytes::from_static(b"+OK\r\n"), Bytes::from_static(b":7\r\n")]);
+        assert!(err.is_some());
+        assert!(router.pipeline_encoded_raw(&buf, 3).await.is_err());
+    }
+
     #[tokio::test]
     async fn standalone_pool_stats() {
         let addr = mock_server_with_responses(vec![b"+PONG\r\n".to_vec()]).await;
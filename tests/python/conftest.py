@@ -0,0 +1,61 @@
+"""Shared pytest configuration for the Python test suite."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--bench-only",
+        action="store_true",
+        default=False,
+        help="Skip correctness checks and run only the timed benchmarks.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "correctness: result comparison against redis-py (skipped by --bench-only)"
+    )
+    config.addinivalue_line(
+        "markers", "micro: basic-command micro-benchmarks (deselect with -m 'not micro')"
+    )
+    config.addinivalue_line(
+        "markers", "slow: waits on a network timeout (deselect with -m 'not slow')"
+    )
+
+
+def _redis_available() -> bool:
+    """Ping ``REDIS_URL`` (or localhost) once.
+
+    Short timeouts keep collection fast when the host is unreachable
+    rather than refusing connections.
+    """
+    from pyrsedis import Redis
+
+    url = os.environ.get("REDIS_URL", "")
+    timeouts = {"connect_timeout_ms": 200, "read_timeout_ms": 1000}
+    try:
+        client = Redis.from_url(url, **timeouts) if url else Redis(**timeouts)
+        return client.ping()
+    except Exception:
+        return False
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--bench-only"):
+        skip = pytest.mark.skip(reason="--bench-only")
+        for item in items:
+            if "correctness" in item.keywords:
+                item.add_marker(skip)
+
+    # Integration tests reach the server through the session ``_client``
+    # fixture; decide once, at collection, whether they can run at all.
+    needs_redis = [item for item in items if "_client" in getattr(item, "fixturenames", ())]
+    if needs_redis and not _redis_available():
+        skip = pytest.mark.skip(reason="Redis server not available")
+        for item in needs_redis:
+            item.add_marker(skip)
@@ -14,20 +14,26 @@ a server nor Docker is available.
 Run with::
 
     pytest tests/python/test_benchmark.py -v -s
-    ./scripts/test-matrix.sh bench
+    pytest tests/python/test_benchmark.py -v -s --bench-only   # skip correctness
+    pytest tests/python/test_benchmark.py -v -s -m "not micro" # graph only
+    ./scripts/test-matrix.sh bench [pytest args...]
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import gc
 import os
 import shutil
 import socket
 import statistics
+import struct
 import subprocess
 import sys
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 from urllib.parse import urlparse
@@ -43,7 +49,10 @@ CONTAINER_NAME = "pyrsedis-bench-falkordb"
 # Graph sizes — override with env vars for quick runs
 GRAPH_NODES = int(os.environ.get("BENCH_NODES", "2_000_000"))
 GRAPH_EDGES_PER_NODE = int(os.environ.get("BENCH_EDGES", "2"))
-BATCH_SIZE = 50_000  # nodes per CREATE batch
+BATCH_SIZE = 50_000  # nodes per CREATE batch (Cypher fallback)
+EDGE_BATCH_SIZE = 10_000  # source nodes per edge batch; keeps the inlined $k/$f lists small
+BULK_BATCH_SIZE = 1_000_000  # entities per GRAPH.BULK call
+SEED_WORKERS = 8  # concurrent batches for the Cypher fallback (pool_size default)
 
 
 # ── Timing infrastructure ──────────────────────────────────────────
@@ -78,11 +87,19 @@ class BenchResult:
         return self.rows_returned / (self.mean_ms / 1000) if self.mean_ms > 0 else 0.0
 
 
+if hasattr(time, "CLOCK_MONOTONIC_RAW"):
+    _raw_clock_ns = functools.partial(time.clock_gettime_ns, time.CLOCK_MONOTONIC_RAW)
+else:
+    _raw_clock_ns = time.perf_counter_ns
+
+
 def timed(
     func: Callable[[], Any],
     label: str = "",
     warmup: int = 1,
     rounds: int = 3,
+    raw_clock: bool = False,
+    pin_gil: bool = True,
 ) -> BenchResult:
     """Run *func* multiple times and collect timings.
 
@@ -92,6 +109,11 @@ def timed(
         label: Human-readable label for the benchmark.
         warmup: Discarded warm-up rounds.
         rounds: Measured rounds.
+        raw_clock: Time with ``CLOCK_MONOTONIC_RAW`` (where available),
+            which is not slewed by NTP — use for multi-second rounds.
+        pin_gil: Raise the GIL switch interval during the rounds.  Pass
+            ``False`` when *func* runs several Python threads, which would
+            otherwise each hold the GIL for up to a second.
 
     Returns:
         A :class:`BenchResult` with per-round wall-clock times.
@@ -100,17 +122,27 @@ def timed(
         func()
 
     result = BenchResult(label=label)
-    gc.disable()
+    raw = [0] * rounds
+    clock = _raw_clock_ns if raw_clock else time.perf_counter_ns
+    # Start from a clean heap and freeze it, so collections during the
+    # rounds only scan the rounds' own garbage (and still free it); keep
+    # GIL switches out of the timed region unless the caller needs them.
+    gc.collect()
+    gc.freeze()
+    switch_interval = sys.getswitchinterval()
+    if pin_gil:
+        sys.setswitchinterval(1.0)
     try:
-        for _ in range(rounds):
-            start = time.perf_counter()
+        for i in range(rounds):
+            start = clock()
             rows = func()
-            elapsed_ms = (time.perf_counter() - start) * 1000
-            result.times_ms.append(elapsed_ms)
+            raw[i] = clock() - start
             if isinstance(rows, int):
                 result.rows_returned = rows
     finally:
-        gc.enable()
+        gc.unfreeze()
+        sys.setswitchinterval(switch_interval)
+    result.times_ms = [ns / 1e6 for ns in raw]
     return result
 
 
@@ -128,12 +160,16 @@ def fmt(name: str, pr: BenchResult, fk: BenchResult) -> str:
 # ── Docker management ──────────────────────────────────────────────
 
 
+@functools.lru_cache(maxsize=4)
 def _parse_host_port(url: str) -> tuple[str, int]:
     """Extract host and port from a redis:// URL."""
     parsed = urlparse(url)
     return parsed.hostname or "127.0.0.1", parsed.port or 6379
 
 
+HOST, PORT = _parse_host_port(REDIS_URL)
+
+
 def _is_reachable(host: str, port: int, timeout: float = 2.0) -> bool:
     """TCP connect check."""
     try:
@@ -143,6 +179,19 @@ def _is_reachable(host: str, port: int, timeout: float = 2.0) -> bool:
         return False
 
 
+def _responds_to_ping(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Send a raw RESP ``PING`` and check for ``+PONG``.
+
+    Cheaper than building a client per poll while the container boots.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.sendall(b"*1\r\n$4\r\nPING\r\n")
+            return sock.recv(64).startswith(b"+PONG")
+    except OSError:
+        return False
+
+
 def _start_falkordb_docker(host: str, port: int) -> bool:
     """Start a FalkorDB container.  Returns True on success."""
     if not shutil.which("docker"):
@@ -170,14 +219,8 @@ def _start_falkordb_docker(host: str, port: int) -> bool:
 
     # Wait for PONG
     for _ in range(60):
-        if _is_reachable(host, port):
-            try:
-                import pyrsedis
-                c = pyrsedis.Redis(host=host, port=port)
-                c.ping()
-                return True
-            except Exception:
-                pass
+        if _responds_to_ping(host, port):
+            return True
         time.sleep(0.5)
 
     return False
@@ -187,6 +230,22 @@ def _stop_falkordb_docker() -> None:
     subprocess.run(["docker", "rm", "-f", CONTAINER_NAME], capture_output=True)
 
 
+def _find_pure_python_parser():
+    """Locate redis-py's pure-Python RESP parser class, if any."""
+    # redis-py 7.x moved parsers to redis._parsers
+    try:
+        from redis._parsers import _RESP2Parser as parser
+    except ImportError:
+        try:
+            from redis.connection import PythonParser as parser
+        except ImportError:
+            return None
+    return parser
+
+
+_PURE_PYTHON_PARSER = _find_pure_python_parser()
+
+
 # ── Fixtures ────────────────────────────────────────────────────────
 
 
@@ -201,7 +260,7 @@ def falkordb_url() -> str:
     cannot start one.
     """
     global _docker_started
-    host, port = _parse_host_port(REDIS_URL)
+    host, port = HOST, PORT
 
     if _is_reachable(host, port):
         return REDIS_URL
@@ -246,7 +305,11 @@ def falkordb_graph(falkordb_url: str):
 
 @pytest.fixture(scope="session")
 def redispy_client(falkordb_url: str):
-    """redis-py client for raw GRAPH.QUERY comparison (uses hiredis if installed)."""
+    """redis-py client for raw GRAPH.QUERY comparison (uses hiredis if installed).
+
+    Replies are decoded to ``str`` by the parser, matching pyrsedis'
+    default ``decode_responses=True``.
+    """
     try:
         import redis
     except ImportError:
@@ -255,29 +318,28 @@ def redispy_client(falkordb_url: str):
             "Run:  uv pip install redis"
         )
 
-    client = redis.Redis.from_url(falkordb_url)
+    client = redis.Redis.from_url(falkordb_url, decode_responses=True)
     client.ping()
     return client
 
 
 @pytest.fixture(scope="session")
-def redispy_nohiredis_client(falkordb_url: str):
+def redispy_nohiredis_client(falkordb_url: str, redispy_client):
     """redis-py client forced to use the pure-Python parser (no hiredis)."""
     import redis
-    # redis-py 7.x moved parsers to redis._parsers
-    try:
-        from redis._parsers import _RESP2Parser as PurePythonParser
-    except ImportError:
-        try:
-            from redis.connection import PythonParser as PurePythonParser
-        except ImportError:
-            pytest.skip("Cannot locate pure-Python parser class in redis-py")
 
-    host, port = _parse_host_port(falkordb_url)
-    pool = redis.ConnectionPool(host=host, port=port, parser_class=PurePythonParser)
-    client = redis.Redis(connection_pool=pool)
-    client.ping()
-    return client
+    if _PURE_PYTHON_PARSER is None:
+        pytest.skip("Cannot locate pure-Python parser class in redis-py")
+
+    # Same pool class and URL as redispy_client, only the parser differs.
+    # The benchmarks are sequential, so two connections are plenty.
+    pool = type(redispy_client.connection_pool).from_url(
+        falkordb_url,
+        parser_class=_PURE_PYTHON_PARSER,
+        max_connections=2,
+        decode_responses=True,
+    )
+    return redis.Redis(connection_pool=pool)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -295,12 +357,16 @@ _graph_seeded = False
 
 
 @pytest.fixture(scope="session")
-def seeded_graph(pyrsedis_client, falkordb_url: str):
+def seeded_graph(pyrsedis_client, redispy_client, falkordb_url: str):
     """Build a million-node graph for traversal benchmarks.
 
     Creates ``GRAPH_NODES`` Person nodes and ``GRAPH_EDGES_PER_NODE``
     random KNOWS edges per node, then creates an index on ``Person.id``.
 
+    The graph is loaded with ``GRAPH.BULK`` (through redis-py, since the
+    payload is binary) and falls back to batched Cypher ``CREATE``
+    statements if the server does not support it.
+
     The graph key is ``bench`` in the default database.
     """
     global _graph_seeded
@@ -327,7 +393,15 @@ def seeded_graph(pyrsedis_client, falkordb_url: str):
     print(f"\n  Seeding graph: {n:,} nodes, ~{n * edges:,} edges...")
     t0 = time.perf_counter()
 
-    # Create index first
+    # GRAPH.BULK BEGIN only accepts a new key; drop any partial graph.
+    pyrsedis_client.delete(graph_key)
+    try:
+        edge_created = _bulk_seed(redispy_client, graph_key, n, t0)
+    except Exception as e:
+        print(f"  GRAPH.BULK failed ({e}), falling back to Cypher CREATE")
+        pyrsedis_client.delete(graph_key)
+        edge_created = _cypher_seed(pyrsedis_client, graph_key, n, t0)
+
     try:
         pyrsedis_client.graph_query(
             graph_key, "CREATE INDEX FOR (p:Person) ON (p.id)"
@@ -335,101 +409,257 @@ def seeded_graph(pyrsedis_client, falkordb_url: str):
     except Exception:
         pass  # index may already exist
 
-    # Batch-create nodes
+    elapsed = time.perf_counter() - t0
+    print(f"  Seeding complete: {elapsed:.1f}s  ({edge_created:,} edges)")
+    _graph_seeded = True
+
+
+# GRAPH.BULK property type tags (see FalkorDB's bulk_insert.c).
+_BI_DOUBLE = 2
+_BI_STRING = 3
+_BI_LONG = 4
+
+_PERSON_HEAD = struct.Struct("=BqB")  # id tag+value, name tag
+_PERSON_TAIL = struct.Struct("=BqBd")  # age tag+value, score tag+value
+_KNOWS_ROW = struct.Struct("=QQBd")  # src, dst, weight tag+value
+_FOLLOWS_ROW = struct.Struct("=QQBq")  # src, dst, since tag+value
+
+
+def _edge_targets(n: int) -> tuple[list[int], list[int]]:
+    """Destination ids of each node's KNOWS and FOLLOWS edge.
+
+    Computed once on the client so both seeders share one definition of
+    the topology and the server does no per-row arithmetic.
+    """
+    return (
+        [(i * 7 + 13) % n for i in range(n)],
+        [(i * 31 + 97) % n for i in range(n)],
+    )
+
+
+def _bulk_header(name: str, props: tuple[str, ...]) -> bytes:
+    """Pack a GRAPH.BULK entity header.
+
+    The header is the NUL-terminated label or relation type, a
+    ``uint32`` property count and the NUL-terminated property names.
+    """
+    parts = [name.encode() + b"\0", struct.pack("=I", len(props))]
+    parts.extend(p.encode() + b"\0" for p in props)
+    return b"".join(parts)
+
+
+def _bulk_seed(client, key: str, n: int, t0: float) -> int:
+    """Load the benchmark graph with the binary ``GRAPH.BULK`` protocol.
+
+    Nodes are sent first so that their internal ids equal ``Person.id``,
+    which lets edge rows reference endpoints by ``id`` directly.
+
+    Args:
+        client: redis-py client (the blobs are binary, not UTF-8).
+        key: Graph key; must not exist yet.
+        n: Number of Person nodes.
+        t0: Seeding start time, for progress output.
+
+    Returns:
+        The number of edges created.
+    """
+    person = _bulk_header("Person", ("id", "name", "age", "score"))
+    knows = _bulk_header("KNOWS", ("weight",))
+    follows = _bulk_header("FOLLOWS", ("since",))
+    begin = ["BEGIN"]
+
+    def send(nodes: int, rels: int, labels: list[bytes], reltypes: list[bytes]) -> None:
+        client.execute_command(
+            "GRAPH.BULK", key, *begin,
+            nodes, rels, len(labels), len(reltypes), *labels, *reltypes,
+        )
+        begin.clear()
+
+    head, tail = _PERSON_HEAD.pack, _PERSON_TAIL.pack
     created = 0
     while created < n:
-        batch = min(BATCH_SIZE, n - created)
-        q = (
-            f"UNWIND range({created}, {created + batch - 1}) AS i "
-            f"CREATE (:Person {{id: i, name: 'person_' + toString(i), "
-            f"age: i % 100, score: toFloat(i) * 0.01}})"
-        )
-        pyrsedis_client.graph_query(graph_key, q)
-        created += batch
+        stop = min(created + BULK_BATCH_SIZE, n)
+        buf = bytearray(person)
+        for i in range(created, stop):
+            buf += head(_BI_LONG, i, _BI_STRING)
+            buf += b"person_%d\0" % i
+            buf += tail(_BI_LONG, i % 100, _BI_DOUBLE, i * 0.01)
+        send(stop - created, 0, [bytes(buf)], [])
+        created = stop
         elapsed = time.perf_counter() - t0
         rate = created / elapsed if elapsed > 0 else 0
         print(f"    {created:>10,} / {n:,}  ({rate:,.0f} nodes/s)")
 
-    # Create edges: each node KNOWS 2 random other nodes
-    print(f"  Creating ~{n * edges:,} edges...")
-    edge_created = 0
+    # Each node KNOWS one node and FOLLOWS another
+    print(f"  Creating ~{n * 2:,} edges...")
+    knows_row, follows_row = _KNOWS_ROW.pack, _FOLLOWS_ROW.pack
+    knows_dst, follows_dst = _edge_targets(n)
     offset = 0
     while offset < n:
-        batch = min(BATCH_SIZE, n - offset)
-        q = (
-            f"UNWIND range({offset}, {offset + batch - 1}) AS i "
-            f"MATCH (a:Person {{id: i}}) "
-            f"MATCH (b:Person {{id: (i * 7 + 13) % {n}}}) "
-            f"CREATE (a)-[:KNOWS {{weight: toFloat(i % 10)}}]->(b)"
-        )
-        pyrsedis_client.graph_query(graph_key, q)
-        offset += batch
-        edge_created += batch
+        stop = min(offset + BULK_BATCH_SIZE, n)
+        kbuf = bytearray(knows)
+        fbuf = bytearray(follows)
+        for i in range(offset, stop):
+            kbuf += knows_row(i, knows_dst[i], _BI_DOUBLE, float(i % 10))
+            fbuf += follows_row(i, follows_dst[i], _BI_LONG, 2020 + i % 6)
+        send(0, 2 * (stop - offset), [], [bytes(kbuf), bytes(fbuf)])
+        offset = stop
+    return 2 * n
+
+
+# Seeding queries take their bounds as parameters so the query text is
+# constant and FalkorDB reuses the cached execution plan for every batch.
+_Q_NODES = (
+    "UNWIND range($s, $e) AS i "
+    "CREATE (:Person {id: i, name: 'person_' + toString(i), "
+    "age: i % 100, score: toFloat(i) * 0.01})"
+)
+# Edge batches take the destination ids as lists: node $s + j KNOWS $k[j]
+# and FOLLOWS $f[j].  Both edges are created in one pass so each batch
+# looks up its source nodes once.
+_Q_EDGES = (
+    "UNWIND range(0, size($k) - 1) AS j "
+    "WITH $s + j AS i, $k[j] AS kd, $f[j] AS fd "
+    "MATCH (a:Person {id: i}) "
+    "MATCH (b:Person {id: kd}) "
+    "MATCH (c:Person {id: fd}) "
+    "CREATE (a)-[:KNOWS {weight: toFloat(i % 10)}]->(b), "
+    "(a)-[:FOLLOWS {since: 2020 + i % 6}]->(c)"
+)
+
+
+def _cypher_params(query: str, **params: int | list[int]) -> str:
+    """Prefix *query* with a ``CYPHER name=value ...`` parameter header."""
+    header = " ".join(f"{k}={v}" for k, v in params.items())
+    return f"CYPHER {header} {query}"
+
+
+def _cypher_seed(client, key: str, n: int, t0: float) -> int:
+    """Load the benchmark graph with batched Cypher statements.
+
+    Fallback for servers without ``GRAPH.BULK``.
 
-    # second edge per node
-    offset = 0
-    while offset < n:
-        batch = min(BATCH_SIZE, n - offset)
-        q = (
-            f"UNWIND range({offset}, {offset + batch - 1}) AS i "
-            f"MATCH (a:Person {{id: i}}) "
-            f"MATCH (b:Person {{id: (i * 31 + 97) % {n}}}) "
-            f"CREATE (a)-[:FOLLOWS {{since: 2020 + i % 6}}]->(b)"
+    Returns:
+        The number of edges created.
+    """
+    # Create index first
+    try:
+        client.graph_query(key, "CREATE INDEX FOR (p:Person) ON (p.id)")
+    except Exception:
+        pass  # index may already exist
+
+    # Batches cover disjoint id ranges, so they are dispatched from
+    # SEED_WORKERS threads; the client releases the GIL and draws one
+    # pooled connection per in-flight query.
+    ranges = [(s, min(s + BATCH_SIZE, n) - 1) for s in range(0, n, BATCH_SIZE)]
+
+    def run(query: str, s: int, e: int, **params: list[int]) -> int:
+        client.graph_query(key, _cypher_params(query, s=s, e=e, **params))
+        return e - s + 1
+
+    with ThreadPoolExecutor(max_workers=SEED_WORKERS) as ex:
+        # Batch-create nodes
+        created = 0
+        for batch in ex.map(lambda r: run(_Q_NODES, *r), ranges):
+            created += batch
+            elapsed = time.perf_counter() - t0
+            rate = created / elapsed if elapsed > 0 else 0
+            print(f"    {created:>10,} / {n:,}  ({rate:,.0f} nodes/s)")
+
+        # Edges need every node to exist: each node KNOWS one node and
+        # FOLLOWS another
+        print(f"  Creating ~{n * 2:,} edges...")
+        knows, follows = _edge_targets(n)
+        edge_ranges = [
+            (s, min(s + EDGE_BATCH_SIZE, n) - 1) for s in range(0, n, EDGE_BATCH_SIZE)
+        ]
+        edge_created = 2 * sum(
+            ex.map(
+                lambda r: run(_Q_EDGES, *r, k=knows[r[0] : r[1] + 1], f=follows[r[0] : r[1] + 1]),
+                edge_ranges,
+            )
         )
-        pyrsedis_client.graph_query(graph_key, q)
-        offset += batch
-        edge_created += batch
 
-    elapsed = time.perf_counter() - t0
-    print(f"  Seeding complete: {elapsed:.1f}s  ({edge_created:,} edges)")
-    _graph_seeded = True
+    return edge_created
+
+
+def _flatten(x):
+    """Yield the scalar leaves of nested lists/tuples in order."""
+    for item in x:
+        if isinstance(item, (list, tuple)):
+            yield from _flatten(item)
+        else:
+            yield item
 
 
 def _extract_count(result) -> int:
-    """Pull an integer count out of a graph_query result (nested arrays)."""
-    # graph_query returns the raw compact result as nested lists
-    # The result set is typically result[1][0][0] or similar
+    """Pull an integer count out of a graph_query result (compact format).
+
+    The reply is ``[header, rows, stats]`` and every cell is a
+    ``[type, value]`` pair, so the header and the type tag are integers
+    too: the count is the *last* integer of the first data row.
+    """
     try:
-        if isinstance(result, (list, tuple)):
-            # Walk into nested structure to find the integer
-            for item in result:
-                if isinstance(item, (list, tuple)):
-                    for row in item:
-                        if isinstance(row, (list, tuple)):
-                            for cell in row:
-                                if isinstance(cell, int):
-                                    return cell
-                                if isinstance(cell, (list, tuple)):
-                                    for v in cell:
-                                        if isinstance(v, int):
-                                            return v
-                        elif isinstance(row, int):
-                            return row
-                elif isinstance(item, int):
-                    return item
+        ints = [v for v in _flatten(result[1][:1]) if type(v) is int]
     except Exception:
-        pass
-    return 0
+        return 0
+    return ints[-1] if ints else 0
 
 
 # ── Helpers for correctness comparison ──────────────────────────────
 
 
 def _normalize_for_comparison(obj):
-    """Recursively convert bytes to strings and normalize types for comparison."""
-    if isinstance(obj, bytes):
-        try:
-            return obj.decode("utf-8")
-        except UnicodeDecodeError:
-            return obj
-    if isinstance(obj, (list, tuple)):
-        return [_normalize_for_comparison(x) for x in obj]
-    return obj
+    """Convert tuples to lists for comparison.
+
+    Both clients decode strings while parsing (redis-py is created with
+    ``decode_responses=True``), so only the container types can differ.
+    Walks the reply with an explicit stack rather than recursion, copying
+    each sequence once, so million-cell results do not pay a Python call
+    per cell.
+    """
+    if not isinstance(obj, (list, tuple)):
+        return obj
+
+    seq = (list, tuple)
+    root = list(obj)
+    stack = [root]
+    while stack:
+        out = stack.pop()
+        for i, x in enumerate(out):
+            if isinstance(x, seq):
+                out[i] = x = list(x)
+                stack.append(x)
+    return root
+
+
+def _assert_rows_match(pr_rows, rp_rows, what: str) -> int:
+    """Assert two result sets hold the same rows and return the row count.
+
+    The rows are compared with a single ``list.__eq__`` (a C-level loop);
+    only if that fails are they normalized and, on a real mismatch, walked
+    in Python to report the first differing row.
+    """
+    assert len(pr_rows) == len(rp_rows), (
+        f"{what}: row count mismatch: pyrsedis={len(pr_rows)}, redis-py={len(rp_rows)}"
+    )
+    if pr_rows == rp_rows:
+        return len(pr_rows)
+
+    pr_norm = _normalize_for_comparison(pr_rows)
+    rp_norm = _normalize_for_comparison(rp_rows)
+    if pr_norm != rp_norm:
+        i = next(i for i, (a, b) in enumerate(zip(pr_norm, rp_norm)) if a != b)
+        raise AssertionError(
+            f"{what} row {i} mismatch:\n  pyrsedis: {pr_norm[i]!r}\n  redis-py: {rp_norm[i]!r}"
+        )
+    return len(pr_rows)
 
 
 # ── Correctness tests ───────────────────────────────────────────────
 
 
+@pytest.mark.correctness
 class TestCorrectnessValidation:
     """Verify pyrsedis returns the same results as redis-py + hiredis.
 
@@ -446,31 +676,20 @@ class TestCorrectnessValidation:
             "GRAPH.QUERY", "bench", cypher, "--compact"
         )
 
-        pr_norm = _normalize_for_comparison(pr_result)
-        rp_norm = _normalize_for_comparison(rp_result)
-
         # Both should be 3-element arrays: [header, data, stats]
-        assert len(pr_norm) == len(rp_norm), (
-            f"Top-level length mismatch: pyrsedis={len(pr_norm)}, redis-py={len(rp_norm)}"
+        assert len(pr_result) == len(rp_result), (
+            f"Top-level length mismatch: pyrsedis={len(pr_result)}, redis-py={len(rp_result)}"
         )
 
         # Compare header (column types)
-        assert pr_norm[0] == rp_norm[0], (
-            f"Header mismatch:\n  pyrsedis: {pr_norm[0]}\n  redis-py: {rp_norm[0]}"
+        pr_header = _normalize_for_comparison(pr_result[0])
+        rp_header = _normalize_for_comparison(rp_result[0])
+        assert pr_header == rp_header, (
+            f"Header mismatch:\n  pyrsedis: {pr_header}\n  redis-py: {rp_header}"
         )
 
-        # Compare data rows
-        pr_data = pr_norm[1]
-        rp_data = rp_norm[1]
-        assert len(pr_data) == len(rp_data), (
-            f"Row count mismatch: pyrsedis={len(pr_data)}, redis-py={len(rp_data)}"
-        )
-        for i, (pr_row, rp_row) in enumerate(zip(pr_data, rp_data)):
-            assert pr_row == rp_row, (
-                f"Row {i} mismatch:\n  pyrsedis: {pr_row}\n  redis-py: {rp_row}"
-            )
-
-        print("\n  Scalar properties: 50 rows validated ✓")
+        rows = _assert_rows_match(pr_result[1], rp_result[1], "Scalar properties")
+        print(f"\n  Scalar properties: {rows} rows validated ✓")
 
     def test_full_nodes_match(self, seeded_graph, pyrsedis_client, redispy_client):
         """RETURN full Node objects — compare pyrsedis vs redis-py+hiredis."""
@@ -481,19 +700,9 @@ class TestCorrectnessValidation:
             "GRAPH.QUERY", "bench", cypher, "--compact"
         )
 
-        pr_norm = _normalize_for_comparison(pr_result)
-        rp_norm = _normalize_for_comparison(rp_result)
-
-        # Compare data rows (element [1])
-        pr_data = pr_norm[1]
-        rp_data = rp_norm[1]
-        assert len(pr_data) == len(rp_data) == 20
-        for i, (pr_row, rp_row) in enumerate(zip(pr_data, rp_data)):
-            assert pr_row == rp_row, (
-                f"Full node row {i} mismatch:\n  pyrsedis: {pr_row}\n  redis-py: {rp_row}"
-            )
-
-        print("\n  Full Node objects: 20 rows validated ✓")
+        rows = _assert_rows_match(pr_result[1], rp_result[1], "Full node")
+        assert rows == 20
+        print(f"\n  Full Node objects: {rows} rows validated ✓")
 
     def test_edge_traversal_match(self, seeded_graph, pyrsedis_client, redispy_client):
         """RETURN edge traversal results — compare pyrsedis vs redis-py+hiredis."""
@@ -508,19 +717,9 @@ class TestCorrectnessValidation:
             "GRAPH.QUERY", "bench", cypher, "--compact"
         )
 
-        pr_norm = _normalize_for_comparison(pr_result)
-        rp_norm = _normalize_for_comparison(rp_result)
-
-        pr_data = pr_norm[1]
-        rp_data = rp_norm[1]
-        assert len(pr_data) == len(rp_data)
-        assert len(pr_data) > 0, "Edge traversal returned no rows"
-        for i, (pr_row, rp_row) in enumerate(zip(pr_data, rp_data)):
-            assert pr_row == rp_row, (
-                f"Edge row {i} mismatch:\n  pyrsedis: {pr_row}\n  redis-py: {rp_row}"
-            )
-
-        print(f"\n  Edge traversal: {len(pr_data)} rows validated ✓")
+        rows = _assert_rows_match(pr_result[1], rp_result[1], "Edge")
+        assert rows > 0, "Edge traversal returned no rows"
+        print(f"\n  Edge traversal: {rows} rows validated ✓")
 
     def test_aggregation_match(self, seeded_graph, pyrsedis_client, redispy_client):
         """RETURN aggregation results — compare pyrsedis vs redis-py+hiredis."""
@@ -535,18 +734,8 @@ class TestCorrectnessValidation:
             "GRAPH.QUERY", "bench", cypher, "--compact"
         )
 
-        pr_norm = _normalize_for_comparison(pr_result)
-        rp_norm = _normalize_for_comparison(rp_result)
-
-        pr_data = pr_norm[1]
-        rp_data = rp_norm[1]
-        assert len(pr_data) == len(rp_data)
-        for i, (pr_row, rp_row) in enumerate(zip(pr_data, rp_data)):
-            assert pr_row == rp_row, (
-                f"Aggregation row {i} mismatch:\n  pyrsedis: {pr_row}\n  redis-py: {rp_row}"
-            )
-
-        print(f"\n  Aggregation: {len(pr_data)} rows validated ✓")
+        rows = _assert_rows_match(pr_result[1], rp_result[1], "Aggregation")
+        print(f"\n  Aggregation: {rows} rows validated ✓")
 
     def test_full_edges_match(self, seeded_graph, pyrsedis_client, redispy_client):
         """RETURN full Edge objects — compare pyrsedis vs redis-py+hiredis."""
@@ -561,24 +750,60 @@ class TestCorrectnessValidation:
             "GRAPH.QUERY", "bench", cypher, "--compact"
         )
 
-        pr_norm = _normalize_for_comparison(pr_result)
-        rp_norm = _normalize_for_comparison(rp_result)
+        rows = _assert_rows_match(pr_result[1], rp_result[1], "Full edge")
+        assert rows > 0, "Full edge query returned no rows"
+        print(f"\n  Full Edge objects: {rows} rows validated ✓")
 
-        pr_data = pr_norm[1]
-        rp_data = rp_norm[1]
-        assert len(pr_data) == len(rp_data)
-        assert len(pr_data) > 0, "Full edge query returned no rows"
-        for i, (pr_row, rp_row) in enumerate(zip(pr_data, rp_data)):
-            assert pr_row == rp_row, (
-                f"Full edge row {i} mismatch:\n  pyrsedis: {pr_row}\n  redis-py: {rp_row}"
-            )
 
-        print(f"\n  Full Edge objects: {len(pr_data)} rows validated ✓")
+# ── Benchmark tests ─────────────────────────────────────────────────
 
+# Traversal queries, built once at import so the timed closures only
+# capture a reference.
+_Q = {
+    "nodes_100k": "MATCH (n:Person) RETURN n.id, n.name, n.age, n.score LIMIT 100000",
+    "nodes_500k": "MATCH (n:Person) RETURN n.id, n.name, n.age, n.score LIMIT 500000",
+    "nodes_all": "MATCH (n:Person) RETURN n.id, n.name, n.age, n.score",
+    "edges_100k": (
+        "MATCH (a:Person)-[r:KNOWS]->(b:Person) "
+        "RETURN a.name, r.weight, b.name LIMIT 100000"
+    ),
+    "edges_all": "MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN a.id, r.weight, b.id",
+    "two_hop_100k": (
+        "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:FOLLOWS]->(c:Person) "
+        "RETURN a.id, b.id, c.id LIMIT 100000"
+    ),
+    "group_by_age": (
+        "MATCH (n:Person) "
+        "RETURN n.age, count(n) AS cnt, avg(n.score) AS avg_score "
+        "ORDER BY cnt DESC"
+    ),
+    "full_nodes_100k": "MATCH (n:Person) RETURN n LIMIT 100000",
+    "full_edges_100k": "MATCH ()-[r:KNOWS]->() RETURN r LIMIT 100000",
+}
+
+# Count-only queries touching every label and relation matrix that _Q
+# reads, with a one-row reply.
+_WARM_QUERIES = (
+    "MATCH (n) RETURN 1 LIMIT 1",
+    "MATCH (n:Person) RETURN count(n), sum(n.age), sum(n.score)",
+    "MATCH (:Person)-[r:KNOWS]->(:Person) RETURN count(r), sum(r.weight)",
+    "MATCH (:Person)-[:KNOWS]->(:Person)-[r:FOLLOWS]->(:Person) RETURN count(r)",
+)
+
+
+@pytest.fixture(scope="class")
+def warm_plans(seeded_graph, pyrsedis_client):
+    """Sync the graph's matrices once before a class's measured rounds.
+
+    The first query to touch a matrix after seeding pays for materializing
+    it, which would otherwise land in round 1 of the first benchmark.
+    """
+    for query in _WARM_QUERIES:
+        pyrsedis_client.graph_ro_query("bench", query)
 
-# ── Benchmark tests ─────────────────────────────────────────────────
 
 
+@pytest.mark.usefixtures("warm_plans")
 class TestGraphTraversal:
     """Million-node graph traversal benchmarks.
 
@@ -589,7 +814,7 @@ class TestGraphTraversal:
     def test_return_all_nodes_100k(self, seeded_graph, pyrsedis_client, falkordb_graph, redispy_client, redispy_nohiredis_client):
         """Traverse and return 100k nodes with all properties."""
         limit = 100_000
-        cypher = f"MATCH (n:Person) RETURN n.id, n.name, n.age, n.score LIMIT {limit}"
+        cypher = _Q["nodes_100k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -620,7 +845,7 @@ class TestGraphTraversal:
     def test_return_all_nodes_500k(self, seeded_graph, pyrsedis_client, falkordb_graph, redispy_client):
         """Traverse and return 500k nodes."""
         limit = 500_000
-        cypher = f"MATCH (n:Person) RETURN n.id, n.name, n.age, n.score LIMIT {limit}"
+        cypher = _Q["nodes_500k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -637,7 +862,7 @@ class TestGraphTraversal:
 
     def test_return_1m_nodes(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Traverse and return all 1M nodes — the headline benchmark."""
-        cypher = "MATCH (n:Person) RETURN n.id, n.name, n.age, n.score"
+        cypher = _Q["nodes_all"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -648,8 +873,10 @@ class TestGraphTraversal:
             _ = result.result_set
             return GRAPH_NODES
 
-        r_pr = timed(via_pyrsedis, "pyrsedis", warmup=0, rounds=3)
-        r_fk = timed(via_falkordb, "falkordb", warmup=0, rounds=3)
+        # One discarded pass per client lets the kernel grow each socket's
+        # receive buffer, so round 1 does not measure TCP autotuning.
+        r_pr = timed(via_pyrsedis, "pyrsedis", warmup=1, rounds=1, raw_clock=True)
+        r_fk = timed(via_falkordb, "falkordb", warmup=1, rounds=1, raw_clock=True)
         print(f"\n{fmt(f'Return {GRAPH_NODES:,} nodes (4 props)', r_pr, r_fk)}")
         print(f"    pyrsedis: {r_pr.rows_per_sec:,.0f} rows/s")
         print(f"    falkordb: {r_fk.rows_per_sec:,.0f} rows/s")
@@ -657,10 +884,7 @@ class TestGraphTraversal:
     def test_edge_traversal_100k(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Traverse 100k edges with source/dest properties."""
         limit = 100_000
-        cypher = (
-            f"MATCH (a:Person)-[r:KNOWS]->(b:Person) "
-            f"RETURN a.name, r.weight, b.name LIMIT {limit}"
-        )
+        cypher = _Q["edges_100k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -677,7 +901,7 @@ class TestGraphTraversal:
 
     def test_edge_traversal_1m(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Traverse all ~1M KNOWS edges."""
-        cypher = "MATCH (a:Person)-[r:KNOWS]->(b:Person) RETURN a.id, r.weight, b.id"
+        cypher = _Q["edges_all"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -688,17 +912,16 @@ class TestGraphTraversal:
             _ = result.result_set
             return GRAPH_NODES
 
-        r_pr = timed(via_pyrsedis, "pyrsedis", warmup=0, rounds=3)
-        r_fk = timed(via_falkordb, "falkordb", warmup=0, rounds=3)
+        # One discarded pass per client lets the kernel grow each socket's
+        # receive buffer, so round 1 does not measure TCP autotuning.
+        r_pr = timed(via_pyrsedis, "pyrsedis", warmup=1, rounds=1, raw_clock=True)
+        r_fk = timed(via_falkordb, "falkordb", warmup=1, rounds=1, raw_clock=True)
         print(f"\n{fmt(f'Edge traversal ~{GRAPH_NODES:,} KNOWS', r_pr, r_fk)}")
 
     def test_two_hop_traversal(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Two-hop traversal — friends of friends."""
         limit = 100_000
-        cypher = (
-            f"MATCH (a:Person)-[:KNOWS]->(b:Person)-[:FOLLOWS]->(c:Person) "
-            f"RETURN a.id, b.id, c.id LIMIT {limit}"
-        )
+        cypher = _Q["two_hop_100k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -715,11 +938,7 @@ class TestGraphTraversal:
 
     def test_aggregation_group_by(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Aggregate: GROUP BY age, count + average score."""
-        cypher = (
-            "MATCH (n:Person) "
-            "RETURN n.age, count(n) AS cnt, avg(n.score) AS avg_score "
-            "ORDER BY cnt DESC"
-        )
+        cypher = _Q["group_by_age"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -737,7 +956,7 @@ class TestGraphTraversal:
     def test_return_full_nodes(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Return full node objects (not just properties) — 100k."""
         limit = 100_000
-        cypher = f"MATCH (n:Person) RETURN n LIMIT {limit}"
+        cypher = _Q["full_nodes_100k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -755,7 +974,7 @@ class TestGraphTraversal:
     def test_return_full_edges(self, seeded_graph, pyrsedis_client, falkordb_graph):
         """Return full edge objects — 100k."""
         limit = 100_000
-        cypher = f"MATCH ()-[r:KNOWS]->() RETURN r LIMIT {limit}"
+        cypher = _Q["full_edges_100k"]
 
         def via_pyrsedis():
             result = pyrsedis_client.graph_query("bench", cypher)
@@ -771,6 +990,7 @@ class TestGraphTraversal:
         print(f"\n{fmt('Return 100k full Edge objects', r_pr, r_fk)}")
 
 
+@pytest.mark.micro
 class TestBasicCommands:
     """Baseline SET/GET/pipeline benchmarks for context."""
 
@@ -802,22 +1022,134 @@ class TestBasicCommands:
             f"{speedup:5.2f}x"
         )
 
+    def test_mset_mget_100k(self, pyrsedis_client, redispy_client):
+        """Compare bulk MSET+MGET throughput (100k keys).
+
+        One round-trip per command, so the timing is dominated by
+        encoding and reply parsing rather than network latency.
+        """
+        n = 100_000
+        mapping = {f"bench:mg:{i}": f"v{i}" for i in range(n)}
+        keys = list(mapping)
+
+        def via_pyrsedis():
+            pyrsedis_client.mset(mapping)
+            pyrsedis_client.mget(*keys)
+            return n * 2
+
+        def via_redispy():
+            redispy_client.mset(mapping)
+            redispy_client.mget(keys)
+            return n * 2
+
+        r_pr = timed(via_pyrsedis, "pyrsedis")
+        r_rp = timed(via_redispy, "redis-py")
+        speedup = r_rp.mean_ms / r_pr.mean_ms if r_pr.mean_ms > 0 else 0
+        print(
+            f"\n  {'MSET+MGET ×100k':<40s}  "
+            f"pyrsedis {r_pr.mean_ms:10.1f} ms   "
+            f"redis-py {r_rp.mean_ms:10.1f} ms   "
+            f"{speedup:5.2f}x"
+        )
+        print(f"    pyrsedis: {r_pr.rows_per_sec:,.0f} keys/s")
+        print(f"    redis-py: {r_rp.rows_per_sec:,.0f} keys/s")
+
+    def test_concurrent_set_get_1k(self, falkordb_url):
+        """Compare concurrent SET+GET (1k keys) over 8 connections each.
+
+        Round-trips overlap, so what remains is encoder and parser cost.
+        pyrsedis runs 8 caller threads through ``auto_pipeline``; redis-py
+        runs ``redis.asyncio`` with ``asyncio.gather`` over a
+        ``BlockingConnectionPool`` capped at 8 connections, since its
+        default pool would open one socket per pending command.  The
+        serial loop is measured by :meth:`test_set_get_1k`.
+        """
+        import pyrsedis
+        import redis.asyncio
+
+        n = 1_000
+        threads = 8
+        keys = [f"bench:cc:{i}" for i in range(n)]
+        vals = [f"v{i}" for i in range(n)]
+        chunks = [(keys[i::threads], vals[i::threads]) for i in range(threads)]
+
+        auto = pyrsedis.Redis.from_url(falkordb_url, pool_size=threads, auto_pipeline=True)
+        pool = ThreadPoolExecutor(max_workers=threads)
+
+        def set_get_chunk(chunk):
+            ks, vs = chunk
+            for k, v in zip(ks, vs):
+                auto.set(k, v)
+            for k in ks:
+                auto.get(k)
+
+        def via_pyrsedis():
+            list(pool.map(set_get_chunk, chunks))
+            return n * 2
+
+        try:
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
+        apool = redis.asyncio.BlockingConnectionPool.from_url(
+            falkordb_url, max_connections=threads, decode_responses=True
+        )
+        aclient = redis.asyncio.Redis(connection_pool=apool)
+
+        async def set_get_gather():
+            await asyncio.gather(*(aclient.set(k, v) for k, v in zip(keys, vals)))
+            await asyncio.gather(*(aclient.get(k) for k in keys))
+
+        def via_redispy():
+            loop.run_until_complete(set_get_gather())
+            return n * 2
+
+        try:
+            r_pr = timed(via_pyrsedis, "pyrsedis auto_pipeline", pin_gil=False)
+            r_rp = timed(via_redispy, "redis-py asyncio")
+        finally:
+            pool.shutdown()
+            # Dropping the last reference stops the batching task and
+            # releases the client's connections.
+            del auto
+            loop.run_until_complete(aclient.aclose())
+            loop.run_until_complete(apool.disconnect())
+            loop.close()
+
+        speedup = r_rp.mean_ms / r_pr.mean_ms if r_pr.mean_ms > 0 else 0
+        print(
+            f"\n  {'SET+GET ×1k concurrent':<40s}  "
+            f"pyrsedis {r_pr.mean_ms:10.1f} ms   "
+            f"redis-py {r_rp.mean_ms:10.1f} ms   "
+            f"{speedup:5.2f}x"
+        )
+
     def test_pipeline_5k(self, pyrsedis_client, redispy_client):
         """Compare pipelined SET throughput (5k ops)."""
         n = 5_000
+        # Build keys/values up front so the rounds measure the pipeline,
+        # not string formatting.  pyrsedis takes str; redis-py gets bytes
+        # so its encoder is skipped.
+        keys = [f"bench:pipe:{i}" for i in range(n)]
+        vals = [f"v{i}" for i in range(n)]
+        pairs = list(zip(keys, vals))
+        pairs_b = [(k.encode(), v.encode()) for k, v in pairs]
 
         def via_pyrsedis():
             pipe = pyrsedis_client.pipeline()
-            for i in range(n):
-                pipe.set(f"bench:pipe:{i}", f"v{i}")
+            for k, v in pairs:
+                pipe.set(k, v)
             pipe.execute()
             return n
 
         def via_redispy():
             pipe = redispy_client.pipeline(transaction=False)
-            for i in range(n):
-                pipe.set(f"bench:pipe:{i}", f"v{i}")
-            pipe.execute()
+            cmd = pipe.execute_command
+            for k, v in pairs_b:
+                cmd("SET", k, v)
+            pipe.execute(raise_on_error=False)
             return n
 
         r_pr = timed(via_pyrsedis, "pyrsedis")
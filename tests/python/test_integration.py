@@ -3,33 +3,83 @@ Python integration test suite for pyrsedis.
 
 Requires a running Redis server (default: localhost:6379).
 Run with: pytest tests/python/ -v
+In parallel (pytest-xdist, one logical DB per worker): pytest tests/python/test_integration.py -n 8
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 import pytest
 
+from pyrsedis import (
+    BusyError,
+    ClusterDownError,
+    ClusterError,
+    GraphError,
+    NoScriptError,
+    ProtocolError,
+    PyrsedisError,
+    ReadOnlyError,
+    Redis,
+    RedisConnectionError,
+    RedisError,
+    RedisTimeoutError,
+    ResponseError,
+    SentinelError,
+    WrongTypeError,
+)
+
+# Empty means "use the Redis() defaults" (localhost:6379).
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
+
+def _worker_db() -> int | None:
+    """Logical DB for this pytest-xdist worker, or ``None`` outside xdist.
+
+    Each worker flushes its own DB, so parallel workers (``pytest -n``)
+    do not clobber each other's keys.  Redis has 16 DBs by default, so
+    more than 16 workers would have to share one; stop instead.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        return None
+    db = int(worker.removeprefix("gw"))
+    if db >= 16:
+        pytest.exit(
+            f"xdist worker {worker} has no Redis DB of its own; run with -n 16 or fewer",
+            returncode=pytest.ExitCode.USAGE_ERROR,
+        )
+    return db
+
+
+def _connect(**kwargs) -> Redis:
+    """Build a client for ``REDIS_URL`` (or localhost) on this worker's DB."""
+    url = REDIS_URL
+    db = _worker_db()
+    if url:
+        if db is not None:
+            url = urlsplit(url)._replace(path=f"/{db}").geturl()
+        return Redis.from_url(url, **kwargs)
+    return Redis(db=db or 0, **kwargs)
+
 
 @pytest.fixture(scope="session")
-def redis_url():
-    return os.environ.get("REDIS_URL", "redis://127.0.0.1:6379")
+def _client():
+    """Redis client shared by the whole session.
 
+    Tests using it are skipped at collection when no server answers
+    (see ``conftest.py``).
+    """
+    return _connect()
 
-@pytest.fixture
-def r():
-    """Fresh Redis client, db flushed before each test."""
-    from pyrsedis import Redis
 
-    url = os.environ.get("REDIS_URL", "")
-    if url:
-        client = Redis.from_url(url)
-    else:
-        client = Redis()
-    try:
-        client.ping()
-    except Exception:
-        pytest.skip("Redis server not available")
-    client.flushdb()
-    return client
+@pytest.fixture
+def r(_client):
+    """Shared Redis client, db flushed before each test."""
+    # ASYNC empties the keyspace immediately and frees memory in the
+    # background, so the reply does not wait for reclamation.
+    _client.execute_command("FLUSHDB", "ASYNC")
+    return _client
 
 
 # ── String commands ─────────────────────────────────────────────────
@@ -43,6 +93,19 @@ class TestStrings:
     def test_get_nonexistent(self, r):
         assert r.get("nonexistent") is None
 
+    def test_get_into(self, r):
+        r.set("k", "hello")
+        buf = bytearray(2)
+        assert r.get_into("k", buf) == 5
+        assert buf == b"hello"
+        r.set("k", "hi")
+        assert r.get_into("k", buf) == 2
+        assert buf[:2] == b"hi"
+        assert len(buf) == 5
+
+    def test_get_into_nonexistent(self, r):
+        assert r.get_into("nonexistent", bytearray(8)) is None
+
     def test_set_with_ex(self, r):
         r.set("k", "v", ex=10)
         ttl = r.ttl("k")
@@ -131,12 +194,14 @@ class TestStrings:
         assert r.get("dst") == "val"
 
     def test_expire_persist_ttl(self, r):
-        r.set("k", "v")
-        assert r.ttl("k") == -1
-        r.expire("k", 10)
-        assert 0 < r.ttl("k") <= 10
-        r.persist("k")
-        assert r.ttl("k") == -1
+        results = (
+            r.pipeline().set("k", "v").ttl("k").expire("k", 10).ttl("k").persist("k").ttl("k").execute()
+        )
+        assert results[1] == -1
+        assert results[2] == 1
+        assert 0 < results[3] <= 10
+        assert results[4] == 1
+        assert results[5] == -1
 
     def test_pexpire_pttl(self, r):
         r.set("k", "v")
@@ -156,14 +221,12 @@ class TestHashes:
         assert r.hget("nosuchhash", "f") is None
 
     def test_hgetall(self, r):
-        r.hset("h", "a", "1")
-        r.hset("h", "b", "2")
+        r.execute_command("HSET", "h", "a", "1", "b", "2")
         result = r.hgetall("h")
         assert len(result) == 4  # flat list: [field, value, field, value]
 
     def test_hdel(self, r):
-        r.hset("h", "a", "1")
-        r.hset("h", "b", "2")
+        r.execute_command("HSET", "h", "a", "1", "b", "2")
         assert r.hdel("h", "a", "nonexistent") == 1
 
     def test_hexists(self, r):
@@ -172,8 +235,7 @@ class TestHashes:
         assert r.hexists("h", "nope") == 0
 
     def test_hkeys_hvals_hlen(self, r):
-        r.hset("h", "a", "1")
-        r.hset("h", "b", "2")
+        r.execute_command("HSET", "h", "a", "1", "b", "2")
         assert r.hlen("h") == 2
         assert len(r.hkeys("h")) == 2
         assert len(r.hvals("h")) == 2
@@ -193,8 +255,7 @@ class TestHashes:
         assert r.hget("h", "f") == "v"
 
     def test_hmget(self, r):
-        r.hset("h", "a", "1")
-        r.hset("h", "b", "2")
+        r.execute_command("HSET", "h", "a", "1", "b", "2")
         result = r.hmget("h", "a", "b", "c")
         assert result[0] == "1"
         assert result[1] == "2"
@@ -258,18 +319,15 @@ class TestSets:
         assert r.scard("s") == 2
 
     def test_sinter(self, r):
-        r.sadd("s1", "a", "b", "c")
-        r.sadd("s2", "b", "c", "d")
+        r.pipeline().sadd("s1", "a", "b", "c").sadd("s2", "b", "c", "d").execute()
         assert len(r.sinter("s1", "s2")) == 2
 
     def test_sunion(self, r):
-        r.sadd("s1", "a", "b")
-        r.sadd("s2", "b", "c")
+        r.pipeline().sadd("s1", "a", "b").sadd("s2", "b", "c").execute()
         assert len(r.sunion("s1", "s2")) == 3
 
     def test_sdiff(self, r):
-        r.sadd("s1", "a", "b", "c")
-        r.sadd("s2", "b", "c")
+        r.pipeline().sadd("s1", "a", "b", "c").sadd("s2", "b", "c").execute()
         result = r.sdiff("s1", "s2")
         assert len(result) == 1
 
@@ -301,9 +359,8 @@ class TestSortedSets:
         assert r.zcount("z", "2", "3") == 2
 
     def test_zrange(self, r):
-        r.zadd("z", {"a": 1, "b": 2, "c": 3})
-        result = r.zrange("z", 0, -1)
-        assert result == ["a", "b", "c"]
+        results = r.pipeline().zadd("z", {"a": 1, "b": 2, "c": 3}).zrange("z", 0, -1).zcard("z").execute()
+        assert results == [3, ["a", "b", "c"], 3]
 
     def test_zrange_withscores(self, r):
         r.zadd("z", {"a": 1, "b": 2})
@@ -343,9 +400,7 @@ class TestPipeline:
         pipe.get("a")
         pipe.get("b")
         results = pipe.execute()
-        assert len(results) == 4
-        assert results[2] == "1"
-        assert results[3] == "2"
+        assert results == [True, True, "1", "2"]
 
     def test_empty_pipeline(self, r):
         pipe = r.pipeline()
@@ -381,16 +436,82 @@ class TestPipeline:
         assert results[2] == "11"
         assert results[3] == 1
 
-    def test_pipeline_large_batch(self, r):
+    def test_pipeline_batch(self, r):
+        keys = [f"k{i}" for i in range(10)]
+        vals = [f"v{i}" for i in range(10)]
         pipe = r.pipeline()
-        for i in range(100):
-            pipe.set(f"k{i}", f"v{i}")
-        for i in range(100):
-            pipe.get(f"k{i}")
+        for k, v in zip(keys, vals):
+            pipe.set(k, v)
+        for k in keys:
+            pipe.get(k)
         results = pipe.execute()
-        assert len(results) == 200
-        # Verify last GET
-        assert results[199] == "v99"
+        assert len(results) == 20
+        assert results[10:] == vals
+
+    def test_pipeline_multi_exec(self, r):
+        keys = [f"k{i}" for i in range(100)]
+        vals = [f"v{i}" for i in range(100)]
+        pipe = r.pipeline().execute_command("MULTI")
+        for k, v in zip(keys, vals):
+            pipe.set(k, v)
+        for k in keys:
+            pipe.get(k)
+        results = pipe.execute_command("EXEC").execute()
+        # MULTI's OK, one QUEUED per command, then EXEC's array of replies.
+        assert len(results) == 202
+        assert results[0] == "OK"
+        assert results[1:-1] == ["QUEUED"] * 200
+        assert len(results[-1]) == 200
+        assert results[-1][100:] == vals
+
+    def test_large_batch_mset_mget(self, r):
+        keys = [f"k{i}" for i in range(100)]
+        vals = [f"v{i}" for i in range(100)]
+        r.mset(dict(zip(keys, vals)))
+        assert r.mget(*keys) == vals
+
+    def test_pipeline_exec(self, r):
+        results = r.pipeline_exec([["SET", "a", "1"], ["INCR", "a"], ["GET", "a"]])
+        assert results == ["OK", 2, "2"]
+
+    def test_pipeline_exec_empty(self, r):
+        assert r.pipeline_exec([]) == []
+
+    def test_pipeline_exec_empty_command(self, r):
+        with pytest.raises(TypeError):
+            r.pipeline_exec([["PING"], []])
+
+
+class TestAutoPipeline:
+    @pytest.fixture
+    def ar(self, r):
+        return _connect(auto_pipeline=True)
+
+    def test_single_commands(self, ar):
+        assert ar.set("k", "v") is True
+        assert ar.get("k") == "v"
+        assert ar.ping() is True
+
+    def test_concurrent_threads(self, ar):
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(lambda _: ar.incr("counter"), range(200)))
+        assert sorted(results) == list(range(1, 201))
+        assert ar.get("counter") == "200"
+
+
+class TestDecodeCache:
+    def test_repeated_values_share_str(self, r):
+        client = _connect(decode_cache=True)
+        r.execute_command("HSET", "h", "a", "active", "b", "active")
+        first, second = client.hmget("h", "a", "b")
+        assert first == "active"
+        assert first is second
+
+    def test_off_by_default(self, r):
+        r.execute_command("HSET", "h", "a", "active", "b", "active")
+        first, second = r.hmget("h", "a", "b")
+        assert first == second
+        assert first is not second
 
 
 # ── Server commands ─────────────────────────────────────────────────
@@ -411,8 +532,15 @@ class TestServer:
     def test_keys(self, r):
         r.set("aaa", "1")
         r.set("bbb", "2")
-        result = r.keys("*")
-        assert len(result) == 2
+        # SCAN instead of KEYS *, which blocks the server for the whole walk.
+        found = set()
+        cursor = 0
+        while True:
+            cursor, keys = r.scan(cursor)
+            found.update(keys)
+            if int(cursor) == 0:
+                break
+        assert found == {"aaa", "bbb"}
 
     def test_info(self, r):
         result = r.info()
@@ -444,11 +572,24 @@ class TestServer:
 # ── Scripting ───────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def cached_shas(_client):
+    """Scripts loaded once per session (FLUSHDB keeps the script cache)."""
+    return {
+        "ret42": _client.script_load("return 42"),
+        "getk": _client.script_load("return redis.call('GET', KEYS[1])"),
+    }
+
+
 class TestScripting:
-    def test_eval_simple(self, r):
-        result = r.eval("return 42", 0)
+    def test_eval_simple(self, r, cached_shas):
+        result = r.evalsha(cached_shas["ret42"], 0)
         assert result == 42
 
+    def test_evalsha_with_keys(self, r, cached_shas):
+        r.set("k", "hello")
+        assert r.evalsha(cached_shas["getk"], 1, "k") == "hello"
+
     def test_eval_with_keys(self, r):
         r.set("k", "hello")
         result = r.eval("return redis.call('GET', KEYS[1])", 1, "k")
@@ -468,90 +609,67 @@ class TestScripting:
         assert isinstance(cursor, (int, str))
 
 
+# (child, parent) pairs of the exception hierarchy.
+_HIERARCHY = [
+    (RedisConnectionError, PyrsedisError),
+    (RedisTimeoutError, PyrsedisError),
+    (ProtocolError, PyrsedisError),
+    (RedisError, PyrsedisError),
+    (GraphError, PyrsedisError),
+    (ClusterError, PyrsedisError),
+    (SentinelError, PyrsedisError),
+    (ResponseError, RedisError),
+    (WrongTypeError, RedisError),
+    (ReadOnlyError, RedisError),
+    (NoScriptError, RedisError),
+    (BusyError, RedisError),
+    (ClusterDownError, RedisError),
+]
+
+
 class TestExceptions:
     """Tests for the custom exception hierarchy."""
 
-    def test_hierarchy(self):
-        """All exceptions inherit from PyrsedisError."""
-        import pyrsedis
-
-        assert issubclass(pyrsedis.RedisConnectionError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.RedisTimeoutError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.ProtocolError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.RedisError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.GraphError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.ClusterError, pyrsedis.PyrsedisError)
-        assert issubclass(pyrsedis.SentinelError, pyrsedis.PyrsedisError)
-
-    def test_redis_error_subclasses(self):
-        """RedisError children form a proper tree."""
-        import pyrsedis
-
-        assert issubclass(pyrsedis.ResponseError, pyrsedis.RedisError)
-        assert issubclass(pyrsedis.WrongTypeError, pyrsedis.RedisError)
-        assert issubclass(pyrsedis.ReadOnlyError, pyrsedis.RedisError)
-        assert issubclass(pyrsedis.NoScriptError, pyrsedis.RedisError)
-        assert issubclass(pyrsedis.BusyError, pyrsedis.RedisError)
-        assert issubclass(pyrsedis.ClusterDownError, pyrsedis.RedisError)
+    @pytest.mark.parametrize("child,parent", _HIERARCHY, ids=lambda c: c.__name__)
+    def test_hierarchy(self, child, parent):
+        """All exceptions inherit from PyrsedisError; RedisError children form a tree."""
+        assert issubclass(child, parent)
 
     def test_wrongtype_error(self, r):
         """WRONGTYPE raises WrongTypeError, catchable as RedisError."""
-        import pyrsedis
-
         r.set("str_key", "hello")
-        with pytest.raises(pyrsedis.WrongTypeError):
+        with pytest.raises(WrongTypeError) as exc_info:
             r.lpush("str_key", "value")
-
-        # Also catchable as RedisError
-        r.set("str_key2", "hello")
-        with pytest.raises(pyrsedis.RedisError):
-            r.lpush("str_key2", "value")
-
-        # And as PyrsedisError
-        r.set("str_key3", "hello")
-        with pytest.raises(pyrsedis.PyrsedisError):
-            r.lpush("str_key3", "value")
+        # The hierarchy is static, so one raised instance covers every base.
+        exc = exc_info.value
+        assert isinstance(exc, RedisError)
+        assert isinstance(exc, PyrsedisError)
+        assert "WRONGTYPE" in str(exc)
 
     def test_response_error_bad_command(self, r):
         """Generic ERR raises ResponseError."""
-        import pyrsedis
-
-        with pytest.raises(pyrsedis.ResponseError):
+        with pytest.raises(ResponseError):
             r.execute_command("SET")  # missing required args
 
     def test_noscript_error(self, r):
         """NOSCRIPT raises NoScriptError."""
-        import pyrsedis
-
-        with pytest.raises(pyrsedis.NoScriptError):
+        with pytest.raises(NoScriptError):
             r.evalsha("0000000000000000000000000000000000000000", 0)
 
+    @pytest.mark.slow
     def test_connection_error(self):
         """Unreachable host raises RedisConnectionError or RedisTimeoutError."""
-        import pyrsedis
-
-        r = pyrsedis.Redis(host="192.0.2.1", port=1, connect_timeout_ms=500)
-        with pytest.raises(pyrsedis.PyrsedisError) as exc_info:
+        # 192.0.2.0/24 (TEST-NET-1) never answers, so the connect attempt
+        # always runs into the timeout; 50ms is enough to see the error.
+        r = Redis(host="192.0.2.1", port=1, connect_timeout_ms=50)
+        with pytest.raises(PyrsedisError) as exc_info:
             r.ping()
-        assert isinstance(exc_info.value, (pyrsedis.RedisConnectionError, pyrsedis.RedisTimeoutError))
+        assert isinstance(exc_info.value, (RedisConnectionError, RedisTimeoutError))
 
     def test_exception_message(self, r):
         """Exception messages contain the Redis error string."""
-        import pyrsedis
-
         r.set("mystr", "hello")
         try:
             r.lpush("mystr", "value")
-        except pyrsedis.WrongTypeError as e:
+        except WrongTypeError as e:
             assert "WRONGTYPE" in str(e)
-
-    @pytest.fixture
-    def r(self):
-        from pyrsedis import Redis
-
-        try:
-            client = Redis()
-            client.flushdb()
-            return client
-        except Exception:
-            pytest.skip("Redis server not available")